@@ -0,0 +1,219 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from threading import Thread
+
+class GenericInputData:
+    def read(self):
+        raise NotImplementedError
+
+    @classmethod
+    def generate_inputs(cls, config):
+        raise NotImplementedError
+
+
+class PathInputData(GenericInputData):
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+
+    def read(self):
+        with open(self.path) as f:
+            return f.read()
+
+    @classmethod
+    def generate_inputs(cls, config):
+        data_dir = config["data_dir"]
+        for name in os.listdir(data_dir):
+            yield cls(os.path.join(data_dir, name))
+
+
+class MappedPathInputData(GenericInputData):
+    def __init__(self, path, start, end, block_size):
+        super().__init__()
+        self.path = path
+        self.start = start
+        self.end = end
+        self.block_size = block_size
+
+    def read(self):
+        with open(self.path, "rb") as f:
+            f.seek(self.start)
+            return f.read(self.end - self.start).decode()
+
+    def read_blocks(self):
+        if self.start == self.end:
+            return
+        with (
+            open(self.path, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+            memoryview(mapped) as view,
+        ):
+            for offset in range(self.start, self.end, self.block_size):
+                end = min(offset + self.block_size, self.end)
+                # Each block is released before the next one is mapped
+                # in, so memory use doesn't depend on the file's size
+                with view[offset:end] as block:
+                    yield block
+
+    @classmethod
+    def generate_inputs(cls, config):
+        data_dir = config["data_dir"]
+        range_size = config.get("range_size", 64 * 1024 * 1024)
+        block_size = config.get("block_size", 1024 * 1024)
+        for name in os.listdir(data_dir):
+            path = os.path.join(data_dir, name)
+            for start, end in split_ranges(path, range_size):
+                yield cls(path, start, end, block_size)
+
+
+def split_ranges(path, range_size):
+    size = os.path.getsize(path)
+    if size == 0:
+        yield (0, 0)
+        return
+
+    with (
+        open(path, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+    ):
+        start = 0
+        while start < size:
+            # Extend each range to the end of the line it stops in, so
+            # no line is split between two workers
+            newline = mapped.find(b"\n", start + range_size - 1)
+            end = size if newline == -1 else newline + 1
+            yield (start, end)
+            start = end
+
+
+class GenericWorker:
+    def __init__(self, input_data):
+        self.input_data = input_data
+        self.result = None
+
+    def map(self):
+        raise NotImplementedError
+
+    def reduce(self, other):
+        raise NotImplementedError
+
+    @classmethod
+    def create_workers(cls, input_class, config):
+        workers = []
+        for input_data in input_class.generate_inputs(config):
+            workers.append(cls(input_data))
+        return workers
+
+
+class LineCountWorker(GenericWorker):
+    def map(self):
+        data = self.input_data.read()
+        self.result = data.count("\n")
+
+    def reduce(self, other):
+        self.result += other.result
+
+
+class ByteLineCountWorker(GenericWorker):
+    def map(self):
+        self.result = 0
+        for block in self.input_data.read_blocks():
+            # Memoryviews have no count method, so this copies at most
+            # one block at a time, but never decodes it into a str
+            self.result += bytes(block).count(b"\n")
+
+    def reduce(self, other):
+        self.result += other.result
+
+
+def execute(workers):
+    threads = [Thread(target=w.map) for w in workers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    first, *rest = workers
+    for worker in rest:
+        first.reduce(worker)
+    return first.result
+
+
+def map_chunk(worker_class, inputs):
+    # Runs in a child process; only the input descriptors are pickled
+    # on the way in, and only one combined worker on the way out
+    first, *rest = [worker_class(input_data) for input_data in inputs]
+    first.map()
+    for worker in rest:
+        worker.map()
+        first.reduce(worker)
+    first.input_data = None  # Don't send the input back
+    return first
+
+def reduce_pair(first, second):
+    first.reduce(second)
+    return first
+
+def tree_reduce(pool, workers):
+    if not workers:
+        raise ValueError("No inputs to reduce")
+    while len(workers) > 1:
+        futures = []
+        for first, second in zip(workers[0::2], workers[1::2]):
+            futures.append(pool.submit(reduce_pair, first, second))
+        leftover = workers[-1:] if len(workers) % 2 else []
+        workers = [future.result() for future in futures] + leftover
+    return workers[0]
+
+def execute_processes(worker_class, inputs, max_workers, chunks_per_worker):
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    # A few chunks per process keeps every process busy without paying
+    # to pickle and dispatch each input on its own
+    chunk_count = max_workers * chunks_per_worker
+    chunk_size = max(1, -(-len(inputs) // chunk_count))
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = []
+        for start in range(0, len(inputs), chunk_size):
+            chunk = inputs[start : start + chunk_size]
+            futures.append(pool.submit(map_chunk, worker_class, chunk))
+        workers = [future.result() for future in futures]
+        return tree_reduce(pool, workers).result
+
+def mapreduce(
+    worker_class,
+    input_class,
+    config,
+    executor="thread",
+    max_workers=None,
+    chunks_per_worker=4,
+):
+    if executor == "thread":
+        workers = worker_class.create_workers(input_class, config)
+        return execute(workers)
+    elif executor == "process":
+        inputs = list(input_class.generate_inputs(config))
+        return execute_processes(
+            worker_class, inputs, max_workers, chunks_per_worker
+        )
+    else:
+        raise ValueError(f"Unknown executor: {executor!r}")
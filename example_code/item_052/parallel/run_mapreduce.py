@@ -0,0 +1,114 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from my_mapreduce import (
+    ByteLineCountWorker,
+    LineCountWorker,
+    MappedPathInputData,
+    PathInputData,
+    mapreduce,
+)
+
+def write_test_files(tmpdir, count):
+    for i in range(count):
+        with open(os.path.join(tmpdir, str(i)), "w") as f:
+            f.write("\n" * random.randint(0, 100))
+
+def write_big_file(tmpdir, line_count):
+    with open(os.path.join(tmpdir, "big.log"), "wb") as f:
+        for _ in range(line_count // 1000):
+            f.write(b"Some log line that goes on for a while\n" * 1000)
+
+def measure(worker_class, input_class, config, **kwargs):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = mapreduce(worker_class, input_class, config, **kwargs)
+    end = time.perf_counter()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, end - start, peak
+
+def compare_streaming():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        write_big_file(tmpdir, 2_000_000)
+        config = {
+            "data_dir": tmpdir,
+            "range_size": 16 * 1024 * 1024,
+            "block_size": 1024 * 1024,
+        }
+
+        expected, delta, peak = measure(LineCountWorker, PathInputData, config)
+        print(f"Reading whole file took {delta:.3f} seconds, "
+              f"peak {peak / 1024 / 1024:.1f} MiB")
+
+        result, delta, peak = measure(
+            ByteLineCountWorker, MappedPathInputData, config
+        )
+        assert result == expected
+        print(f"Streaming blocks took {delta:.3f} seconds, "
+              f"peak {peak / 1024 / 1024:.1f} MiB")
+
+        start = time.perf_counter()
+        result = mapreduce(
+            ByteLineCountWorker,
+            MappedPathInputData,
+            config,
+            executor="process",
+            max_workers=4,
+        )
+        end = time.perf_counter()
+        assert result == expected
+        print(f"Streaming byte ranges in 4 processes took "
+              f"{end - start:.3f} seconds")
+
+def main():
+    random.seed(1234)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        write_test_files(tmpdir, 2000)
+        config = {"data_dir": tmpdir}
+
+        start = time.perf_counter()
+        expected = mapreduce(LineCountWorker, PathInputData, config)
+        end = time.perf_counter()
+        delta = end - start
+        print(f"Threads took {delta:.3f} seconds")
+
+        for max_workers in (1, 2, 4, 8):
+            start = time.perf_counter()
+            result = mapreduce(
+                LineCountWorker,
+                PathInputData,
+                config,
+                executor="process",
+                max_workers=max_workers,
+            )
+            end = time.perf_counter()
+            delta = end - start
+            assert result == expected
+            print(f"{max_workers} processes took {delta:.3f} seconds")
+
+        print(f"There are {result} lines")
+
+    compare_streaming()
+
+if __name__ == "__main__":
+    main()
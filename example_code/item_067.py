@@ -186,3 +186,149 @@ except subprocess.TimeoutExpired:
     proc.wait()
 
 print("Exit status", proc.poll())
+
+
+print("Example 12")
+import asyncio
+import hashlib
+
+class StageStats:
+    def __init__(self, name):
+        self.name = name
+        self.byte_count = 0
+        self.start = time.perf_counter()
+        self.end = None
+
+    def add(self, size):
+        self.byte_count += size
+
+    def finish(self):
+        self.end = time.perf_counter()
+
+    def throughput(self):
+        return self.byte_count / (self.end - self.start)
+
+
+async def feed_input(chunks, stdin, stats):
+    for chunk in chunks:
+        stdin.write(chunk)
+        await stdin.drain()  # Wait while the child is behind
+        stats.add(len(chunk))
+    stdin.close()
+    await stdin.wait_closed()
+    stats.finish()
+
+async def relay_output(stdout, stdin, stats, chunk_size, verify=False):
+    # Hashing here would repeat the child's work on the event loop, so
+    # only do it when checking the pipeline end to end
+    digest = hashlib.sha256() if verify else None
+    while chunk := await stdout.read(chunk_size):
+        if digest:
+            digest.update(chunk)
+        stdin.write(chunk)
+        await stdin.drain()
+        stats.add(len(chunk))
+    stdin.close()
+    await stdin.wait_closed()
+    stats.finish()
+    return digest.digest() if digest else None
+
+
+print("Example 13")
+async def run_chain(chunks, timeout, chunk_size=64 * 1024, verify=False):
+    env = os.environ.copy()
+    env["password"] = "zf7ShyBhZOraQDdE/FiZpm/m/8f9X+M1"
+    encrypt_stats = StageStats("encrypt")
+    hash_stats = StageStats("hash")
+    procs = []
+    try:
+        encrypt_proc = await asyncio.create_subprocess_exec(
+            "openssl", "enc", "-des3", "-pbkdf2", "-pass", "env:password",
+            env=env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        procs.append(encrypt_proc)
+        hash_proc = await asyncio.create_subprocess_exec(
+            "openssl", "dgst", "-sha256", "-binary",
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        procs.append(hash_proc)
+
+        async with asyncio.timeout(timeout):
+            async with asyncio.TaskGroup() as group:
+                group.create_task(
+                    feed_input(chunks, encrypt_proc.stdin, encrypt_stats)
+                )
+                relay = group.create_task(
+                    relay_output(
+                        encrypt_proc.stdout,
+                        hash_proc.stdin,
+                        hash_stats,
+                        chunk_size,
+                        verify,
+                    )
+                )
+                output = group.create_task(hash_proc.stdout.read())
+            await encrypt_proc.wait()
+            await hash_proc.wait()
+    except BaseException:
+        for proc in procs:
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+        raise
+
+    assert encrypt_proc.returncode == 0
+    assert hash_proc.returncode == 0
+    if verify:
+        # The digest computed while relaying must match what the child got
+        assert output.result() == relay.result()
+    return output.result(), [encrypt_stats, hash_stats]
+
+
+print("Example 14")
+def generate_chunks(total_size, chunk_size):
+    block = os.urandom(chunk_size)
+    for offset in range(0, total_size, chunk_size):
+        yield block[: min(chunk_size, total_size - offset)]
+
+async def run_chains(count, total_size, concurrency, timeout):
+    limit = asyncio.Semaphore(concurrency)
+
+    async def run_one():
+        async with limit:
+            chunks = generate_chunks(total_size, 64 * 1024)
+            return await run_chain(chunks, timeout)
+
+    return await asyncio.gather(*(run_one() for _ in range(count)))
+
+
+start = time.perf_counter()
+results = asyncio.run(run_chains(4, 8 * 1024 * 1024, 2, 30))
+end = time.perf_counter()
+
+for digest, stages in results:
+    summary = ", ".join(
+        f"{stats.name} {stats.throughput() / 1e6:.1f} MB/s"
+        for stats in stages
+    )
+    print(f"{digest[-10:]!r}: {summary}")
+
+total = 4 * 8 * 1024 * 1024
+print(f"Pushed {total / 1e6:.0f} MB in {end - start:.3f} seconds")
+
+chunks = generate_chunks(1024 * 1024, 64 * 1024)
+digest, _ = asyncio.run(run_chain(chunks, timeout=30, verify=True))
+print(f"Verified {digest[-10:]!r} against a digest taken while relaying")
+
+
+print("Example 15")
+try:
+    chunks = generate_chunks(1024 * 1024 * 1024, 64 * 1024)
+    asyncio.run(run_chain(chunks, timeout=0.1))
+except TimeoutError:
+    print("Chain timed out and its processes were killed")
+else:
+    assert False
@@ -154,3 +154,130 @@ for thread in threads:
 
 expected = how_many * sensor_count
 print(f"Counter should be {expected}, got {counter}")
+
+
+print("Example 8")
+import threading
+import time
+
+class ShardedCounter:
+    def __init__(self):
+        self.local = threading.local()
+        self.shards = []
+        self.shards_lock = Lock()  # Only for adding and reading shards
+
+    def add(self, amount):
+        try:
+            shard = self.local.shard
+        except AttributeError:
+            shard = self.local.shard = [0]
+            with self.shards_lock:
+                self.shards.append(shard)
+        # Only the current thread ever writes to its own shard, so this
+        # is safe without a lock, even in free-threaded builds
+        shard[0] += amount
+
+    def value(self):
+        with self.shards_lock:
+            return sum(shard[0] for shard in self.shards)
+
+
+print("Example 9")
+def sharded_worker(counter, sensor_index, how_many, flush_interval):
+    BARRIER.wait()
+    pending = 0
+    for i in range(1, how_many + 1):
+        data = read_sensor(sensor_index)
+        pending += get_offset(data)
+        # Publish to the shared counter now and then so that live
+        # readers see progress without paying for it every time
+        if i % flush_interval == 0:
+            counter.add(pending)
+            pending = 0
+    counter.add(pending)
+
+
+counter = ShardedCounter()
+BARRIER = Barrier(sensor_count + 1)
+
+threads = []
+for i in range(sensor_count):
+    args = (counter, i, how_many, 1000)
+    thread = Thread(target=sharded_worker, args=args)
+    threads.append(thread)
+    thread.start()
+
+BARRIER.wait()
+live_reads = []
+while any(thread.is_alive() for thread in threads):
+    live_reads.append(counter.value())
+    time.sleep(0.01)
+
+for thread in threads:
+    thread.join()
+
+assert live_reads == sorted(live_reads)
+expected = how_many * sensor_count
+print(f"Counter should be {expected}, got {counter.value()}")
+
+
+print("Example 10")
+def sharded_add_worker(counter, sensor_index, how_many):
+    BARRIER.wait()
+    for _ in range(how_many):
+        data = read_sensor(sensor_index)
+        counter.add(get_offset(data))
+
+def run_counting(thread_count, total, target, make_args):
+    global BARRIER
+    BARRIER = Barrier(thread_count)
+    per_thread = total // thread_count
+
+    threads = []
+    for i in range(thread_count):
+        args = make_args(i, per_thread)
+        threads.append(Thread(target=target, args=args))
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    end = time.perf_counter()
+    return end - start
+
+
+total = 800_000
+for thread_count in (1, 2, 4, 8):
+    counter = 0
+    locked = run_counting(
+        thread_count,
+        total,
+        locking_worker,
+        lambda i, n: (i, n),
+    )
+    assert counter == total
+
+    sharded = ShardedCounter()
+    unbatched = run_counting(
+        thread_count,
+        total,
+        sharded_add_worker,
+        lambda i, n: (sharded, i, n),
+    )
+    assert sharded.value() == total
+
+    sharded = ShardedCounter()
+    batched = run_counting(
+        thread_count,
+        total,
+        sharded_worker,
+        lambda i, n: (sharded, i, n, 1000),
+    )
+    assert sharded.value() == total
+
+    print(
+        f"{thread_count} threads: locked {locked:.3f}s, "
+        f"sharded {unbatched:.3f}s, "
+        f"sharded with batches {batched:.3f}s"
+    )
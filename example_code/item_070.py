@@ -380,3 +380,375 @@ for thread in threads:
     thread.join()
 
 print(counter, "items finished")
+
+
+print("Example 26")
+from queue import Empty
+from threading import Event
+
+class ScalableWorker(StoppableWorker):
+    def __init__(self, stage):
+        super().__init__(stage.func, stage.in_queue, stage.out_queue)
+        self.stage = stage
+        self.retired = False
+
+    def run(self):
+        started = time.perf_counter()
+        self.stage.record_start(self, started)
+        try:
+            self.work()
+        finally:
+            self.stage.record_lifetime(self, time.perf_counter() - started)
+
+    def work(self):
+        while not self.retired:
+            try:
+                # Wake up periodically to notice being retired
+                item = self.in_queue.get(timeout=0.05)
+            except Empty:
+                continue
+            except ShutDown:
+                return
+            else:
+                start = time.perf_counter()
+                result = self.func(item)
+                middle = time.perf_counter()
+                self.out_queue.put(result)  # Blocks when downstream is full
+                end = time.perf_counter()
+                self.stage.record(middle - start, end - middle)
+                self.in_queue.task_done()
+
+
+class Stage:
+    def __init__(self, func, in_queue, out_queue, max_threads):
+        self.func = func
+        self.in_queue = in_queue
+        self.out_queue = out_queue
+        self.max_threads = max_threads
+        self.threads = []
+        self.lock = Lock()
+        self.processed = 0
+        self.busy_time = 0
+        self.blocked_time = 0
+        self.thread_time = 0
+        self.running = {}  # Start times of threads that haven't exited
+        self.last_busy_time = 0
+
+    def record(self, busy, blocked):
+        with self.lock:
+            self.processed += 1
+            self.busy_time += busy
+            self.blocked_time += blocked
+
+    def record_start(self, thread, started):
+        with self.lock:
+            self.running[thread] = started
+
+    def record_lifetime(self, thread, lifetime):
+        with self.lock:
+            del self.running[thread]
+            self.thread_time += lifetime
+
+    def total_thread_time(self, now):
+        with self.lock:
+            live = sum(now - started for started in self.running.values())
+            return self.thread_time + live
+
+    def add_thread(self):
+        thread = ScalableWorker(self)
+        thread.start()
+        self.threads.append(thread)
+
+    def remove_thread(self):
+        thread = self.threads.pop()
+        thread.retired = True
+        return thread
+
+
+print("Example 27")
+class Pipeline:
+    def __init__(self, funcs, max_threads=8, queue_size=100, interval=0.02):
+        self.interval = interval
+        self.queues = [Queue()]
+        self.queues += [Queue(queue_size) for _ in funcs[1:]]
+        self.queues.append(Queue())
+        self.stages = []
+        for i, func in enumerate(funcs):
+            in_queue, out_queue = self.queues[i], self.queues[i + 1]
+            stage = Stage(func, in_queue, out_queue, max_threads)
+            self.stages.append(stage)
+        self.retired = []
+        self.stopped = Event()
+        self.monitor = Thread(target=self.autoscale)
+        self.start_time = None
+        self.end_time = None
+
+    def start(self):
+        self.start_time = time.perf_counter()
+        for stage in self.stages:
+            stage.add_thread()
+        self.monitor.start()
+
+    def put(self, item):
+        self.queues[0].put(item)
+
+    def autoscale(self):
+        while not self.stopped.wait(self.interval):
+            for stage in self.stages:
+                self.rebalance(stage)
+
+    def rebalance(self, stage):
+        with stage.lock:
+            busy = stage.busy_time - stage.last_busy_time
+            stage.last_busy_time = stage.busy_time
+        thread_count = len(stage.threads)
+        utilization = busy / (thread_count * self.interval)
+        depth = stage.in_queue.qsize()
+
+        # Add threads while work is piling up in front of busy workers,
+        # and give them back once the stage is mostly idle
+        if depth > thread_count and utilization > 0.8:
+            if thread_count < stage.max_threads:
+                stage.add_thread()
+        elif depth == 0 and utilization < 0.3 and thread_count > 1:
+            self.retired.append(stage.remove_thread())
+
+    def close(self):
+        for queue in self.queues[:-1]:
+            queue.shutdown()
+            queue.join()
+        self.end_time = time.perf_counter()
+
+        self.stopped.set()
+        self.monitor.join()
+        for stage in self.stages:
+            for thread in stage.threads:
+                thread.join()
+        for thread in self.retired:
+            thread.join()
+
+        return drain_queue(self.queues[-1])
+
+    def stats(self):
+        # Works while running too, counting up to the current time
+        now = time.perf_counter()
+        elapsed = (self.end_time or now) - self.start_time
+        results = {}
+        for stage in self.stages:
+            thread_time = stage.total_thread_time(now) or 1
+            results[stage.func.__name__] = {
+                "threads": len(stage.threads),
+                "throughput": stage.processed / elapsed,
+                "utilization": stage.busy_time / thread_time,
+                "backpressure": stage.blocked_time / thread_time,
+            }
+        return results
+
+
+print("Example 28")
+def download(item):
+    time.sleep(0.0002)
+    return item
+
+def resize(item):
+    time.sleep(0.002)  # The slow stage
+    return item
+
+def upload(item):
+    time.sleep(0.0005)
+    return item
+
+
+def run_pipeline(max_threads):
+    pipeline = Pipeline([download, resize, upload], max_threads=max_threads)
+    pipeline.start()
+    for _ in range(500):
+        pipeline.put(object())
+    counter = pipeline.close()
+    return counter, pipeline
+
+
+counter, fixed = run_pipeline(max_threads=1)
+print(counter, "items finished with one thread per stage in "
+      f"{fixed.end_time - fixed.start_time:.3f} seconds")
+
+counter, scaled = run_pipeline(max_threads=16)
+print(counter, "items finished with autoscaling in "
+      f"{scaled.end_time - scaled.start_time:.3f} seconds")
+
+def print_stats(pipeline):
+    for name, stats in pipeline.stats().items():
+        print(
+            f"{name:>8}: {stats['threads']:2} threads, "
+            f"{stats['throughput']:7.1f} items/s, "
+            f"{stats['utilization']:.0%} utilization, "
+            f"{stats['backpressure']:.0%} backpressure"
+        )
+
+print_stats(scaled)
+
+live = Pipeline([download, resize, upload], max_threads=16)
+live.start()
+for _ in range(500):
+    live.put(object())
+time.sleep(0.05)
+print("While running:")
+print_stats(live)
+live.close()
+
+
+print("Example 29")
+from threading import Condition
+
+class ConditionQueue:
+    def __init__(self):
+        self.items = deque()
+        self.condition = Condition()
+        self.closed = False
+        self.wait_count = 0
+        self.wait_time = 0
+
+    def put(self, item):
+        with self.condition:
+            self.items.append(item)
+            self.condition.notify()
+
+    def put_many(self, items):
+        with self.condition:
+            self.items.extend(items)
+            self.condition.notify(len(items))
+
+    def get(self, timeout=None):
+        return self.get_many(1, timeout)[0]
+
+    def get_many(self, count, timeout=None):
+        with self.condition:
+            if not self.items and not self.closed:
+                start = time.perf_counter()
+                self.condition.wait_for(
+                    lambda: self.items or self.closed, timeout
+                )
+                end = time.perf_counter()
+                self.wait_count += 1
+                self.wait_time += end - start
+
+            if not self.items:
+                # Same signal as MyQueue when there's nothing to return
+                raise IndexError("Queue is empty")
+
+            count = min(count, len(self.items))
+            return [self.items.popleft() for _ in range(count)]
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+
+print("Example 30")
+class BlockingWorker(Worker):
+    def __init__(self, func, in_queue, out_queue, batch_size=1):
+        super().__init__(func, in_queue, out_queue)
+        self.batch_size = batch_size
+        self.empty_count = 0
+
+    def run(self):
+        while True:
+            self.polled_count += 1
+            try:
+                items = self.in_queue.get_many(self.batch_size)
+            except IndexError:
+                self.empty_count += 1
+                return  # Closed and there's nothing left to do
+            else:
+                results = [self.func(item) for item in items]
+                self.out_queue.put_many(results)
+                self.work_done += len(items)
+
+
+print("Example 31")
+# Restore the original versions of these functions
+def download(item):
+    return item
+
+def resize(item):
+    return item
+
+def upload(item):
+    return item
+
+
+def produce(queue, count, burst_size=100, idle=0.1):
+    # Items arrive in bursts with quiet periods in between, which is
+    # when the polling workers spin without finding anything to do
+    for i in range(count):
+        queue.put(object())
+        if i % burst_size == burst_size - 1:
+            time.sleep(idle)
+
+def run_polling(count):
+    queues = [MyQueue() for _ in range(4)]
+    threads = [
+        Worker(download, queues[0], queues[1]),
+        Worker(resize, queues[1], queues[2]),
+        Worker(upload, queues[2], queues[3]),
+    ]
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    produce(queues[0], count)
+    while len(queues[3].items) < count:
+        time.sleep(0.001)
+    end = time.perf_counter()
+
+    for thread in threads:
+        thread.in_queue = None
+        thread.join()
+
+    return threads, end - start
+
+def run_blocking(count, batch_size):
+    queues = [ConditionQueue() for _ in range(4)]
+    threads = [
+        BlockingWorker(download, queues[0], queues[1], batch_size),
+        BlockingWorker(resize, queues[1], queues[2], batch_size),
+        BlockingWorker(upload, queues[2], queues[3], batch_size),
+    ]
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    produce(queues[0], count)
+    for queue, thread in zip(queues, threads):
+        queue.close()
+        thread.join()
+    end = time.perf_counter()
+
+    assert len(queues[3].items) == count
+    return threads, end - start, queues
+
+
+def print_stats(name, threads, delta):
+    processed = sum(t.work_done for t in threads)
+    polled = sum(t.polled_count for t in threads)
+    print(f"{name}: processed {processed} items after polling "
+          f"{polled} times ({polled / processed:.2f} polls per item) "
+          f"in {delta:.3f} seconds")
+
+
+threads, delta = run_polling(1000)
+print_stats("MyQueue", threads, delta)
+empty_polls = sum(t.polled_count - t.work_done for t in threads)
+print(f"MyQueue: {empty_polls} empty polls, "
+      f"sleeping {empty_polls * 0.01:.3f} seconds in total")
+
+for batch_size in (1, 10):
+    threads, delta, queues = run_blocking(1000, batch_size)
+    name = f"ConditionQueue with batches of {batch_size}"
+    print_stats(name, threads, delta)
+    empty_polls = sum(t.empty_count for t in threads)
+    wait_count = sum(queue.wait_count for queue in queues)
+    wait_time = sum(queue.wait_time for queue in queues)
+    print(f"{name}: {empty_polls} empty polls, blocked {wait_count} "
+          f"times, waiting {wait_time:.3f} seconds in total")
@@ -235,3 +235,619 @@ print("Example 9")
 def game_logic(state, neighbors):
     # Do some blocking input/output in here:
     data = my_socket.recv(100)
+
+
+print("Example 10")
+# Restore the working version of this function
+def game_logic(state, neighbors):
+    if state == ALIVE:
+        if neighbors < 2:
+            return EMPTY     # Die: Too few
+        elif neighbors > 3:
+            return EMPTY     # Die: Too many
+    else:
+        if neighbors == 3:
+            return ALIVE     # Regenerate
+    return state
+
+
+BIT_TO_CELL = str.maketrans({"1": ALIVE, "0": EMPTY})
+
+class BitGrid:
+    def __init__(self, height, width):
+        self.height = height
+        self.width = width
+        self.mask = (1 << width) - 1
+        self.rows = [0] * height  # Bit x of each row is column x
+
+    def get(self, y, x):
+        row = self.rows[y % self.height]
+        if (row >> (x % self.width)) & 1:
+            return ALIVE
+        return EMPTY
+
+    def set(self, y, x, state):
+        y %= self.height
+        bit = 1 << (x % self.width)
+        if state == ALIVE:
+            self.rows[y] |= bit
+        else:
+            self.rows[y] &= ~bit
+
+    def __str__(self):
+        output = []
+        for row in self.rows:
+            bits = format(row, f"0{self.width}b")[::-1]
+            output.append(bits.translate(BIT_TO_CELL))
+            output.append("\n")
+        return "".join(output)
+
+    @classmethod
+    def from_grid(cls, grid):
+        bit_grid = cls(grid.height, grid.width)
+        for y in range(grid.height):
+            for x in range(grid.width):
+                bit_grid.set(y, x, grid.get(y, x))
+        return bit_grid
+
+
+print("Example 11")
+def rotate_left(row, width, mask):
+    return ((row << 1) | (row >> (width - 1))) & mask
+
+def rotate_right(row, width, mask):
+    return ((row >> 1) | (row << (width - 1))) & mask
+
+def simulate_bits(grid):
+    width, mask = grid.width, grid.mask
+    rows = grid.rows
+    above = rows[-1:] + rows[:-1]  # Wrap the top edge around
+    below = rows[1:] + rows[:1]    # Wrap the bottom edge around
+
+    next_grid = BitGrid(grid.height, grid.width)
+    for y, (n_, row, s_) in enumerate(zip(above, rows, below)):
+        neighbor_rows = [
+            n_,                             # North
+            rotate_right(n_, width, mask),  # Northeast
+            rotate_right(row, width, mask),  # East
+            rotate_right(s_, width, mask),  # Southeast
+            s_,                             # South
+            rotate_left(s_, width, mask),  # Southwest
+            rotate_left(row, width, mask),  # West
+            rotate_left(n_, width, mask),   # Northwest
+        ]
+        # Count all of the neighbors for the whole row at once by
+        # adding the shifted rows together one bit-plane at a time
+        ones = twos = fours = 0
+        for neighbors in neighbor_rows:
+            carry = ones & neighbors
+            ones ^= neighbors
+            fours |= twos & carry
+            twos ^= carry
+        # Survive with 2 or 3 neighbors, regenerate with exactly 3
+        next_grid.rows[y] = twos & ~fours & (ones | row)
+
+    return next_grid
+
+
+print("Example 12")
+def simulate(grid):
+    if isinstance(grid, BitGrid):
+        return simulate_bits(grid)
+
+    next_grid = Grid(grid.height, grid.width)
+    for y in range(grid.height):
+        for x in range(grid.width):
+            step_cell(y, x, grid.get, next_grid.set)
+    return next_grid
+
+
+grid = BitGrid(5, 9)
+grid.set(0, 3, ALIVE)
+grid.set(1, 4, ALIVE)
+grid.set(2, 2, ALIVE)
+grid.set(2, 3, ALIVE)
+grid.set(2, 4, ALIVE)
+
+columns = ColumnPrinter()
+for i in range(5):
+    columns.append(str(grid))
+    grid = simulate(grid)
+
+print(columns)
+
+
+print("Example 13")
+import time
+
+def random_grid(height, width):
+    grid = Grid(height, width)
+    for y in range(height):
+        for x in range(width):
+            if random.random() < 0.3:
+                grid.set(y, x, ALIVE)
+    return grid
+
+def time_generations(grid, generations):
+    start = time.perf_counter()
+    for _ in range(generations):
+        grid = simulate(grid)
+    end = time.perf_counter()
+    return grid, end - start
+
+
+slow_grid = random_grid(200, 200)
+fast_grid = BitGrid.from_grid(slow_grid)
+
+slow_grid, slow_delta = time_generations(slow_grid, 5)
+fast_grid, fast_delta = time_generations(fast_grid, 5)
+
+assert str(slow_grid) == str(fast_grid)
+print(f"Per-cell took {slow_delta:.3f} seconds")
+print(f"Bit-packed took {fast_delta:.3f} seconds")
+print(f"{slow_delta / fast_delta:.0f}x speedup")
+
+
+print("Example 14")
+from collections import Counter
+
+NEIGHBOR_OFFSETS = [
+    (-1, 0),   # North
+    (-1, 1),   # Northeast
+    (0, 1),    # East
+    (1, 1),    # Southeast
+    (1, 0),    # South
+    (1, -1),   # Southwest
+    (0, -1),   # West
+    (-1, -1),  # Northwest
+]
+
+class SparseGrid:
+    def __init__(self, height, width):
+        self.height = height
+        self.width = width
+        self.alive = set()
+
+    def get(self, y, x):
+        if (y % self.height, x % self.width) in self.alive:
+            return ALIVE
+        return EMPTY
+
+    def set(self, y, x, state):
+        position = (y % self.height, x % self.width)
+        if state == ALIVE:
+            self.alive.add(position)
+        else:
+            self.alive.discard(position)
+
+    def __str__(self):
+        rows = [[EMPTY] * self.width for _ in range(self.height)]
+        for y, x in self.alive:
+            rows[y][x] = ALIVE
+        return "".join("".join(row) + "\n" for row in rows)
+
+
+def simulate_sparse(grid):
+    height, width = grid.height, grid.width
+    counts = Counter()
+    for y, x in grid.alive:
+        for dy, dx in NEIGHBOR_OFFSETS:
+            counts[(y + dy) % height, (x + dx) % width] += 1
+
+    # Cells that no live cell touches stay EMPTY, so only the
+    # neighbors of live cells need to be considered
+    next_grid = SparseGrid(height, width)
+    for position, neighbors in counts.items():
+        state = ALIVE if position in grid.alive else EMPTY
+        if game_logic(state, neighbors) == ALIVE:
+            next_grid.alive.add(position)
+
+    return next_grid
+
+
+print("Example 15")
+import functools
+
+class Node:
+    __slots__ = ("level", "nw", "ne", "sw", "se", "population")
+
+    def __init__(self, level, nw, ne, sw, se, population):
+        self.level = level  # Covers 2**level x 2**level cells
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.population = population
+
+
+ON = Node(0, None, None, None, None, 1)
+OFF = Node(0, None, None, None, None, 0)
+
+@functools.cache
+def join(nw, ne, sw, se):
+    # Caching makes identical quadrants the same object, which lets
+    # the results of advancing them be shared too
+    population = (
+        nw.population + ne.population + sw.population + se.population
+    )
+    return Node(nw.level + 1, nw, ne, sw, se, population)
+
+@functools.cache
+def empty_node(level):
+    if level == 0:
+        return OFF
+    child = empty_node(level - 1)
+    return join(child, child, child, child)
+
+def step_center(node):
+    # Advance the middle 2x2 of a 4x4 node by one generation
+    cells = [
+        [node.nw.nw, node.nw.ne, node.ne.nw, node.ne.ne],
+        [node.nw.sw, node.nw.se, node.ne.sw, node.ne.se],
+        [node.sw.nw, node.sw.ne, node.se.nw, node.se.ne],
+        [node.sw.sw, node.sw.se, node.se.sw, node.se.se],
+    ]
+
+    def next_cell(y, x):
+        neighbors = 0
+        for dy, dx in NEIGHBOR_OFFSETS:
+            neighbors += cells[y + dy][x + dx].population
+        state = ALIVE if cells[y][x] is ON else EMPTY
+        return ON if game_logic(state, neighbors) == ALIVE else OFF
+
+    return join(
+        next_cell(1, 1),
+        next_cell(1, 2),
+        next_cell(2, 1),
+        next_cell(2, 2),
+    )
+
+@functools.cache
+def advance(node, step):
+    # Returns the center half of the node after 2**step generations,
+    # where step can be at most node.level - 2
+    if node.population == 0:
+        return empty_node(node.level - 1)
+    if node.level == 2:
+        return step_center(node)
+
+    nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+    c1 = advance(join(nw.nw, nw.ne, nw.sw, nw.se), step)
+    c2 = advance(join(nw.ne, ne.nw, nw.se, ne.sw), step)
+    c3 = advance(join(ne.nw, ne.ne, ne.sw, ne.se), step)
+    c4 = advance(join(nw.sw, nw.se, sw.nw, sw.ne), step)
+    c5 = advance(join(nw.se, ne.sw, sw.ne, se.nw), step)
+    c6 = advance(join(ne.sw, ne.se, se.nw, se.ne), step)
+    c7 = advance(join(sw.nw, sw.ne, sw.sw, sw.se), step)
+    c8 = advance(join(sw.ne, se.nw, sw.se, se.sw), step)
+    c9 = advance(join(se.nw, se.ne, se.sw, se.se), step)
+
+    if step < node.level - 2:
+        # Only the first half of the generations are needed, so
+        # stitch the centers of the intermediate results together
+        return join(
+            join(c1.se, c2.sw, c4.ne, c5.nw),
+            join(c2.se, c3.sw, c5.ne, c6.nw),
+            join(c4.se, c5.sw, c7.ne, c8.nw),
+            join(c5.se, c6.sw, c8.ne, c9.nw),
+        )
+
+    return join(
+        advance(join(c1, c2, c4, c5), step),
+        advance(join(c2, c3, c5, c6), step),
+        advance(join(c4, c5, c7, c8), step),
+        advance(join(c5, c6, c8, c9), step),
+    )
+
+
+print("Example 16")
+def build_node(level, cells, y=0, x=0):
+    if not cells:
+        return empty_node(level)
+    if level == 0:
+        return ON
+
+    half = 1 << (level - 1)
+    quadrants = [[], [], [], []]
+    for cell_y, cell_x in cells:
+        index = 2 * (cell_y >= y + half) + (cell_x >= x + half)
+        quadrants[index].append((cell_y, cell_x))
+
+    return join(
+        build_node(level - 1, quadrants[0], y, x),
+        build_node(level - 1, quadrants[1], y, x + half),
+        build_node(level - 1, quadrants[2], y + half, x),
+        build_node(level - 1, quadrants[3], y + half, x + half),
+    )
+
+def collect_cells(node, alive, y=0, x=0):
+    if node.population == 0:
+        return
+    if node.level == 0:
+        alive.add((y, x))
+        return
+
+    half = 1 << (node.level - 1)
+    collect_cells(node.nw, alive, y, x)
+    collect_cells(node.ne, alive, y, x + half)
+    collect_cells(node.sw, alive, y + half, x)
+    collect_cells(node.se, alive, y + half, x + half)
+
+def advance_torus(node, step):
+    # Tiling the torus four times and taking the center of the result
+    # wraps every edge correctly, but offsets it by half the board
+    shifted = advance(join(node, node, node, node), step)
+    return join(shifted.se, shifted.sw, shifted.ne, shifted.nw)
+
+def simulate_hashlife(grid, generations):
+    level = grid.width.bit_length() - 1
+    if grid.height != grid.width or grid.width != 1 << level or level < 1:
+        raise ValueError("HashLife needs a square power-of-two grid")
+
+    node = build_node(level, list(grid.alive))
+    max_step = level - 1
+    step = 0
+    while generations:
+        if step == max_step:
+            for _ in range(generations):
+                node = advance_torus(node, step)
+            break
+        if generations & 1:
+            node = advance_torus(node, step)
+        generations >>= 1
+        step += 1
+
+    next_grid = SparseGrid(grid.height, grid.width)
+    collect_cells(node, next_grid.alive)
+    return next_grid
+
+
+print("Example 17")
+def simulate(grid):
+    if isinstance(grid, BitGrid):
+        return simulate_bits(grid)
+    if isinstance(grid, SparseGrid):
+        return simulate_sparse(grid)
+
+    next_grid = Grid(grid.height, grid.width)
+    for y in range(grid.height):
+        for x in range(grid.width):
+            step_cell(y, x, grid.get, next_grid.set)
+    return next_grid
+
+
+grid = SparseGrid(5, 9)
+grid.set(0, 3, ALIVE)
+grid.set(1, 4, ALIVE)
+grid.set(2, 2, ALIVE)
+grid.set(2, 3, ALIVE)
+grid.set(2, 4, ALIVE)
+
+columns = ColumnPrinter()
+for i in range(5):
+    columns.append(str(grid))
+    grid = simulate(grid)
+
+print(columns)
+
+
+print("Example 18")
+def add_glider(grid, y, x):
+    grid.set(y + 0, x + 1, ALIVE)
+    grid.set(y + 1, x + 2, ALIVE)
+    grid.set(y + 2, x + 0, ALIVE)
+    grid.set(y + 2, x + 1, ALIVE)
+    grid.set(y + 2, x + 2, ALIVE)
+
+def glider_field(cls, size, count):
+    grid = cls(size, size)
+    per_row = size // 16
+    for i in range(count):
+        add_glider(grid, 16 * (i // per_row), 16 * (i % per_row))
+    return grid
+
+
+expected = glider_field(BitGrid, 64, 10)
+for _ in range(100):
+    expected = simulate(expected)
+
+sparse_grid = glider_field(SparseGrid, 64, 10)
+for _ in range(100):
+    sparse_grid = simulate(sparse_grid)
+
+hashlife_grid = simulate_hashlife(glider_field(SparseGrid, 64, 10), 100)
+
+assert str(sparse_grid) == str(expected)
+assert str(hashlife_grid) == str(expected)
+
+
+print("Example 19")
+def generations_per_second(grid, generations):
+    start = time.perf_counter()
+    for _ in range(generations):
+        grid = simulate(grid)
+    end = time.perf_counter()
+    return generations / (end - start)
+
+
+for size in (256, 4096):
+    for count in (10, 100, 250):
+        grid = glider_field(SparseGrid, size, count)
+        rate = generations_per_second(grid, 20)
+        print(f"{size}x{size} with {5 * count} live cells: "
+              f"{rate:,.0f} generations/second")
+
+grid = glider_field(SparseGrid, 4096, 250)
+start = time.perf_counter()
+result = simulate_hashlife(grid, 1_000_000)
+end = time.perf_counter()
+assert len(result.alive) == len(grid.alive)
+print(f"HashLife took {end - start:.3f} seconds for 1,000,000 generations")
+
+
+print("Example 20")
+def grid_rows(grid):
+    if isinstance(grid, SparseGrid):
+        # Group the live cells by row, so unchanged rows compare equal
+        # to their previous snapshot just like the other grid types
+        columns = [set() for _ in range(grid.height)]
+        for y, x in grid.alive:
+            columns[y].add(x)
+        return [frozenset(row) for row in columns]
+    return grid.rows
+
+def render_row(grid, row):
+    if isinstance(grid, BitGrid):
+        bits = format(row, f"0{grid.width}b")[::-1]
+        return bits.translate(BIT_TO_CELL)
+    if isinstance(grid, SparseGrid):
+        cells = [EMPTY] * grid.width
+        for x in row:
+            cells[x] = ALIVE
+        return "".join(cells)
+    return "".join(row)
+
+class GridRenderer:
+    def __init__(self):
+        self.snapshots = []
+        self.lines = []
+        self.rendered_count = 0
+
+    def render(self, grid):
+        if len(self.lines) != grid.height:
+            self.snapshots = [None] * grid.height
+            self.lines = [""] * grid.height
+
+        # Only rows that differ from the previous generation are turned
+        # back into strings; every other row reuses its cached line
+        for y, row in enumerate(grid_rows(grid)):
+            if row == self.snapshots[y]:
+                continue
+            if isinstance(row, list):
+                row = row.copy()
+            self.snapshots[y] = row
+            self.lines[y] = render_row(grid, row)
+            self.rendered_count += 1
+
+        return self.lines
+
+
+print("Example 21")
+class StreamingColumnPrinter:
+    def __init__(self):
+        self.columns = []
+
+    def append(self, data):
+        if isinstance(data, str):
+            lines = data.splitlines()  # Split only once
+        else:
+            lines = list(data)         # Renderers reuse their list
+        self.columns.append(lines)
+
+    def iter_rows(self):
+        header = []
+        for i, lines in enumerate(self.columns):
+            padding = " " * (len(lines[0]) // 2) if lines else ""
+            header.append(padding + str(i) + padding)
+        yield " | ".join(header)
+
+        row_count = max((len(lines) for lines in self.columns), default=0)
+        for j in range(row_count):
+            yield " | ".join(
+                lines[j] if j < len(lines) else "" for lines in self.columns
+            )
+
+    def write_to(self, output):
+        for j, row in enumerate(self.iter_rows()):
+            if j > 0:
+                output.write("\n")
+            output.write(row)
+
+    def __str__(self):
+        return "\n".join(self.iter_rows())
+
+
+grid = BitGrid(5, 9)
+grid.set(0, 3, ALIVE)
+grid.set(1, 4, ALIVE)
+grid.set(2, 2, ALIVE)
+grid.set(2, 3, ALIVE)
+grid.set(2, 4, ALIVE)
+
+renderer = GridRenderer()
+columns = StreamingColumnPrinter()
+for i in range(5):
+    columns.append(renderer.render(grid))
+    grid = simulate(grid)
+
+columns.write_to(STDOUT)
+print()
+
+
+print("Example 22")
+grid = BitGrid.from_grid(random_grid(300, 300))
+slow_columns = ColumnPrinter()
+fast_columns = StreamingColumnPrinter()
+for i in range(5):
+    slow_columns.append(str(grid))
+    fast_columns.append(str(grid))
+    grid = simulate(grid)
+
+start = time.perf_counter()
+slow_output = str(slow_columns)
+end = time.perf_counter()
+slow_delta = end - start
+
+start = time.perf_counter()
+fast_output = str(fast_columns)
+end = time.perf_counter()
+fast_delta = end - start
+
+assert slow_output == fast_output
+print(f"ColumnPrinter took {slow_delta:.3f} seconds for 300x300")
+print(f"StreamingColumnPrinter took {fast_delta:.3f} seconds for 300x300")
+
+
+print("Example 23")
+slow_grid = Grid(2000, 2000)
+for i in range(10):
+    add_glider(slow_grid, 200 * i, 200 * i)
+grid = BitGrid.from_grid(slow_grid)
+
+start = time.perf_counter()
+slow_output = str(slow_grid)
+end = time.perf_counter()
+print(f"Grid.__str__ took {end - start:.3f} seconds for 2000x2000")
+
+start = time.perf_counter()
+fast_output = "".join(line + "\n" for line in GridRenderer().render(grid))
+end = time.perf_counter()
+assert slow_output == fast_output
+print(f"First render took {end - start:.3f} seconds for 2000x2000")
+
+renderer = GridRenderer()
+columns = StreamingColumnPrinter()
+start = time.perf_counter()
+for i in range(10):
+    columns.append(renderer.render(grid))
+    grid = simulate(grid)
+
+with open("columns.txt", "w") as output:
+    columns.write_to(output)
+end = time.perf_counter()
+
+print(f"Rendered {renderer.rendered_count} of {10 * grid.height} rows")
+print(f"10 generations took {end - start:.3f} seconds to render and write")
+
+
+print("Example 24")
+grid = glider_field(SparseGrid, 256, 8)
+renderer = GridRenderer()
+generations = 20
+for i in range(generations):
+    lines = renderer.render(grid)
+    assert lines == str(grid).splitlines()
+    grid = simulate(grid)
+
+total_rows = grid.height * generations
+print(f"Rendered {renderer.rendered_count} of {total_rows} sparse rows")
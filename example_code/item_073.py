@@ -411,3 +411,192 @@ except SimulationError:
     pass  # Expected
 else:
     assert False
+
+
+print("Example 12")
+import time
+
+# Restore the working version of this function
+def count_neighbors(y, x, get_cell):
+    n_ = get_cell(y - 1, x + 0)  # North
+    ne = get_cell(y - 1, x + 1)  # Northeast
+    e_ = get_cell(y + 0, x + 1)  # East
+    se = get_cell(y + 1, x + 1)  # Southeast
+    s_ = get_cell(y + 1, x + 0)  # South
+    sw = get_cell(y + 1, x - 1)  # Southwest
+    w_ = get_cell(y + 0, x - 1)  # West
+    nw = get_cell(y - 1, x - 1)  # Northwest
+    neighbor_states = [n_, ne, e_, se, s_, sw, w_, nw]
+    count = 0
+    for state in neighbor_states:
+        if state == ALIVE:
+            count += 1
+    return count
+
+class TimedWorker(StoppableWorker):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_time = 0
+        self.compute_time = 0
+
+    def run(self):
+        while True:
+            start = time.perf_counter()
+            try:
+                item = self.in_queue.get()
+            except ShutDown:
+                return
+            else:
+                middle = time.perf_counter()
+                result = self.func(item)
+                end = time.perf_counter()
+                self.wait_time += middle - start
+                self.compute_time += end - middle
+                self.out_queue.put(result)
+                self.in_queue.task_done()
+
+
+print("Example 13")
+def game_logic_chunk(item):
+    start, end, grid = item
+    next_rows = []
+    for y in range(start, end):
+        next_row = []
+        for x in range(grid.width):
+            state = grid.get(y, x)
+            neighbors = count_neighbors(y, x, grid.get)
+            try:
+                next_state = game_logic(state, neighbors)
+            except Exception as e:
+                return (start, None, (y, x, e))
+            next_row.append(next_state)
+        next_rows.append(next_row)
+    return (start, next_rows, None)
+
+def simulate_pipeline_chunked(grid, in_queue, out_queue, chunk_size, timings):
+    start = time.perf_counter()
+
+    chunk_count = 0
+    for y in range(0, grid.height, chunk_size):
+        end = min(y + chunk_size, grid.height)
+        in_queue.put((y, end, grid))                # Fan-out
+        chunk_count += 1
+
+    middle = time.perf_counter()
+
+    # Every chunk produces exactly one result, so there's no need to
+    # wait for the input queue to drain or to check its size
+    next_grid = Grid(grid.height, grid.width)
+    for _ in range(chunk_count):
+        y, next_rows, error = out_queue.get()       # Fan-in
+        if error:
+            error_y, error_x, e = error
+            raise SimulationError(error_y, error_x) from e
+        next_grid.rows[y : y + len(next_rows)] = next_rows
+
+    end = time.perf_counter()
+    timings["fan_out"] += middle - start
+    timings["fan_in"] += end - middle
+
+    return next_grid
+
+
+grid = Grid(5, 9)
+grid.set(0, 3, ALIVE)
+grid.set(1, 4, ALIVE)
+grid.set(2, 2, ALIVE)
+grid.set(2, 3, ALIVE)
+grid.set(2, 4, ALIVE)
+
+in_queue = Queue()
+out_queue = Queue()
+threads = []
+for _ in range(5):
+    thread = TimedWorker(game_logic_chunk, in_queue, out_queue)
+    thread.start()
+    threads.append(thread)
+
+timings = {"fan_out": 0, "fan_in": 0}
+columns = ColumnPrinter()
+for i in range(5):
+    columns.append(str(grid))
+    grid = simulate_pipeline_chunked(grid, in_queue, out_queue, 2, timings)
+
+print(columns)
+
+in_queue.shutdown()
+in_queue.join()
+
+for thread in threads:
+    thread.join()
+
+
+print("Example 14")
+def random_grid(height, width):
+    grid = Grid(height, width)
+    for y in range(height):
+        for x in range(width):
+            if random.random() < 0.3:
+                grid.set(y, x, ALIVE)
+    return grid
+
+def run_pipeline(grid, generations, func, simulate):
+    in_queue = Queue()
+    out_queue = Queue()
+    threads = []
+    for _ in range(5):
+        thread = TimedWorker(func, in_queue, out_queue)
+        thread.start()
+        threads.append(thread)
+
+    timings = {"fan_out": 0, "fan_in": 0}
+    start = time.perf_counter()
+    for _ in range(generations):
+        grid = simulate(grid, in_queue, out_queue, timings)
+    end = time.perf_counter()
+
+    in_queue.shutdown()
+    in_queue.join()
+    for thread in threads:
+        thread.join()
+
+    timings["total"] = end - start
+    timings["worker_wait"] = sum(t.wait_time for t in threads)
+    timings["worker_compute"] = sum(t.compute_time for t in threads)
+    return grid, timings
+
+def print_timings(label, timings):
+    print(
+        f"{label:>12}: "
+        f"total={timings['total']:.3f}s "
+        f"fan_out={timings['fan_out']:.3f}s "
+        f"fan_in={timings['fan_in']:.3f}s "
+        f"worker_wait={timings['worker_wait']:.3f}s "
+        f"worker_compute={timings['worker_compute']:.3f}s"
+    )
+
+
+def simulate_per_cell(grid, in_queue, out_queue, timings):
+    start = time.perf_counter()
+    next_grid = simulate_pipeline(grid, in_queue, out_queue)
+    end = time.perf_counter()
+    timings["fan_in"] += end - start  # Not separable from fan-out
+    return next_grid
+
+start_grid = random_grid(100, 100)
+expected, timings = run_pipeline(
+    start_grid, 3, game_logic_thread, simulate_per_cell
+)
+print_timings("per cell", timings)
+
+for chunk_size in (1, 5, 25, 100):
+    def simulate_chunked(grid, in_queue, out_queue, timings):
+        return simulate_pipeline_chunked(
+            grid, in_queue, out_queue, chunk_size, timings
+        )
+
+    result, timings = run_pipeline(
+        start_grid, 3, game_logic_chunk, simulate_chunked
+    )
+    assert str(result) == str(expected)
+    print_timings(f"{chunk_size} rows", timings)
@@ -0,0 +1,81 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+import time
+
+from tiled_life import ALIVE, Grid, game_logic, simulate_tiled
+
+def count_neighbors(y, x, get_cell):
+    n_ = get_cell(y - 1, x + 0)  # North
+    ne = get_cell(y - 1, x + 1)  # Northeast
+    e_ = get_cell(y + 0, x + 1)  # East
+    se = get_cell(y + 1, x + 1)  # Southeast
+    s_ = get_cell(y + 1, x + 0)  # South
+    sw = get_cell(y + 1, x - 1)  # Southwest
+    w_ = get_cell(y + 0, x - 1)  # West
+    nw = get_cell(y - 1, x - 1)  # Northwest
+    neighbor_states = [n_, ne, e_, se, s_, sw, w_, nw]
+    count = 0
+    for state in neighbor_states:
+        if state == ALIVE:
+            count += 1
+    return count
+
+def step_cell(y, x, get_cell, set_cell):
+    state = get_cell(y, x)
+    neighbors = count_neighbors(y, x, get_cell)
+    next_state = game_logic(state, neighbors)
+    set_cell(y, x, next_state)
+
+def simulate(grid):
+    next_grid = Grid(grid.height, grid.width)
+    for y in range(grid.height):
+        for x in range(grid.width):
+            step_cell(y, x, grid.get, next_grid.set)
+    return next_grid
+
+def random_grid(height, width):
+    grid = Grid(height, width)
+    for y in range(height):
+        for x in range(width):
+            if random.random() < 0.3:
+                grid.set(y, x, ALIVE)
+    return grid
+
+def main():
+    random.seed(1234)
+    grid = random_grid(300, 300)
+    generations = 5
+
+    start = time.perf_counter()
+    expected = grid
+    for _ in range(generations):
+        expected = simulate(expected)
+    end = time.perf_counter()
+    delta = end - start
+    print(f"Serial took {delta:.3f} seconds")
+
+    for workers in (1, 2, 4, 8):
+        start = time.perf_counter()
+        result = simulate_tiled(grid, workers=workers, generations=generations)
+        end = time.perf_counter()
+        delta = end - start
+        assert str(result) == str(expected)
+        print(f"Tiled with {workers} workers took {delta:.3f} seconds")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+ALIVE = "*"
+EMPTY = "-"
+
+class Grid:
+    def __init__(self, height, width):
+        self.height = height
+        self.width = width
+        self.rows = []
+        for _ in range(self.height):
+            self.rows.append([EMPTY] * self.width)
+
+    def get(self, y, x):
+        return self.rows[y % self.height][x % self.width]
+
+    def set(self, y, x, state):
+        self.rows[y % self.height][x % self.width] = state
+
+    def __str__(self):
+        output = ""
+        for row in self.rows:
+            for cell in row:
+                output += cell
+            output += "\n"
+        return output
+
+
+def game_logic(state, neighbors):
+    if state == ALIVE:
+        if neighbors < 2:
+            return EMPTY
+        elif neighbors > 3:
+            return EMPTY
+    else:
+        if neighbors == 3:
+            return ALIVE
+    return state
+
+
+# Cells are stored one byte each in shared memory, with two full
+# boards back to back: one being read and one being written
+CELL_TO_BYTE = bytes.maketrans(ALIVE.encode() + EMPTY.encode(), b"\x01\x00")
+BYTE_TO_CELL = bytes.maketrans(b"\x01\x00", ALIVE.encode() + EMPTY.encode())
+
+SHARED = None
+
+def attach_shared(name):
+    global SHARED
+    # Only the parent process should unlink the memory when it's done
+    SHARED = shared_memory.SharedMemory(name=name, track=False)
+
+def step_row(above, row, below):
+    width = len(row)
+    next_row = bytearray(width)
+    for x in range(width):
+        left = x - 1  # Negative indexes wrap around on their own
+        right = (x + 1) % width
+        neighbors = (
+            above[left] + above[x] + above[right] +
+            row[left] + row[right] +
+            below[left] + below[x] + below[right]
+        )
+        state = ALIVE if row[x] else EMPTY
+        if game_logic(state, neighbors) == ALIVE:
+            next_row[x] = 1
+    return next_row
+
+def step_tile(height, width, start, end, source, target):
+    cells = SHARED.buf
+    source_offset = source * height * width
+    target_offset = target * height * width
+
+    def read_row(y):
+        offset = source_offset + (y % height) * width
+        return bytes(cells[offset : offset + width])
+
+    # The only rows read from outside of this tile are the halo rows
+    # directly above and below it; every other row stays local
+    above = read_row(start - 1)
+    row = read_row(start)
+    for y in range(start, end):
+        below = read_row(y + 1)
+        offset = target_offset + y * width
+        cells[offset : offset + width] = step_row(above, row, below)
+        above, row = row, below
+
+def split_tiles(height, count):
+    count = max(1, min(count, height))
+    bounds = [height * i // count for i in range(count + 1)]
+    return list(zip(bounds, bounds[1:]))
+
+def simulate_tiled(grid, workers=4, generations=1):
+    height, width = grid.height, grid.width
+    board_size = height * width
+    shared = shared_memory.SharedMemory(create=True, size=2 * board_size)
+    try:
+        data = "".join("".join(row) for row in grid.rows)
+        shared.buf[:board_size] = data.encode().translate(CELL_TO_BYTE)
+
+        tiles = split_tiles(height, workers)
+        source, target = 0, 1
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=attach_shared,
+            initargs=(shared.name,),
+        ) as pool:
+            for _ in range(generations):
+                futures = []
+                for start, end in tiles:
+                    args = (height, width, start, end, source, target)
+                    futures.append(pool.submit(step_tile, *args))
+                for future in futures:
+                    future.result()  # Every tile must finish the generation
+                source, target = target, source
+
+        offset = source * board_size
+        data = bytes(shared.buf[offset : offset + board_size])
+    finally:
+        shared.close()
+        shared.unlink()
+
+    next_grid = Grid(height, width)
+    cells = data.translate(BYTE_TO_CELL).decode()
+    for y in range(height):
+        next_grid.rows[y] = list(cells[y * width : (y + 1) * width])
+    return next_grid
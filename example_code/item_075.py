@@ -231,3 +231,127 @@ for i in range(5):
 print(columns)
 
 logging.getLogger().setLevel(logging.DEBUG)
+
+
+print("Example 6")
+# Restore the versions of these functions where only game_logic
+# is a coroutine, since it's the only part that does I/O
+def count_neighbors(y, x, get_cell):
+    n_ = get_cell(y - 1, x + 0)  # North
+    ne = get_cell(y - 1, x + 1)  # Northeast
+    e_ = get_cell(y + 0, x + 1)  # East
+    se = get_cell(y + 1, x + 1)  # Southeast
+    s_ = get_cell(y + 1, x + 0)  # South
+    sw = get_cell(y + 1, x - 1)  # Southwest
+    w_ = get_cell(y + 0, x - 1)  # West
+    nw = get_cell(y - 1, x - 1)  # Northwest
+    neighbor_states = [n_, ne, e_, se, s_, sw, w_, nw]
+    count = 0
+    for state in neighbor_states:
+        if state == ALIVE:
+            count += 1
+    return count
+
+async def step_cell(y, x, get_cell, set_cell):
+    state = get_cell(y, x)
+    neighbors = count_neighbors(y, x, get_cell)
+    next_state = await game_logic(state, neighbors)
+    set_cell(y, x, next_state)
+
+
+print("Example 7")
+async def step_rows(queue, grid, next_grid):
+    while True:
+        try:
+            start, end = await queue.get()
+        except asyncio.QueueShutDown:
+            return
+
+        for y in range(start, end):
+            for x in range(grid.width):
+                state = grid.get(y, x)
+                neighbors = count_neighbors(y, x, grid.get)
+                next_state = await game_logic(state, neighbors)
+                next_grid.set(y, x, next_state)
+
+        queue.task_done()
+
+async def simulate_batched(grid, workers=10, batch_rows=1):
+    next_grid = Grid(grid.height, grid.width)
+
+    # The bounded queue keeps the number of pending batches small no
+    # matter how many rows the grid has
+    queue = asyncio.Queue(maxsize=workers)
+
+    async with asyncio.TaskGroup() as group:
+        for _ in range(workers):
+            group.create_task(step_rows(queue, grid, next_grid))
+
+        for start in range(0, grid.height, batch_rows):
+            end = min(start + batch_rows, grid.height)
+            await queue.put((start, end))                # Fan-out
+
+        queue.shutdown()
+
+    # Exiting the TaskGroup waits for every worker to finish (fan-in)
+    return next_grid
+
+
+logging.getLogger().setLevel(logging.ERROR)
+
+grid = Grid(5, 9)
+grid.set(0, 3, ALIVE)
+grid.set(1, 4, ALIVE)
+grid.set(2, 2, ALIVE)
+grid.set(2, 3, ALIVE)
+grid.set(2, 4, ALIVE)
+
+columns = ColumnPrinter()
+for i in range(5):
+    columns.append(str(grid))
+    grid = asyncio.run(simulate_batched(grid, workers=2))
+
+print(columns)
+
+logging.getLogger().setLevel(logging.DEBUG)
+
+
+print("Example 8")
+import random
+import time
+import tracemalloc
+
+def random_grid(height, width):
+    grid = Grid(height, width)
+    for y in range(height):
+        for x in range(width):
+            if random.random() < 0.3:
+                grid.set(y, x, ALIVE)
+    return grid
+
+def measure(simulate, grid):
+    tracemalloc.start()
+    start = time.perf_counter()
+    next_grid = asyncio.run(simulate(grid))
+    end = time.perf_counter()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return next_grid, end - start, peak
+
+
+logging.getLogger().setLevel(logging.ERROR)
+
+for size in (50, 100, 200):
+    grid = random_grid(size, size)
+    expected, gather_delta, gather_peak = measure(simulate, grid)
+    result, batched_delta, batched_peak = measure(simulate_batched, grid)
+    assert str(result) == str(expected)
+    print(
+        f"{size}x{size}: "
+        f"gather took {gather_delta:.3f} seconds, "
+        f"peak {gather_peak / 1024:,.0f} KiB; "
+        f"batched took {batched_delta:.3f} seconds, "
+        f"peak {batched_peak / 1024:,.0f} KiB"
+    )
+
+logging.getLogger().setLevel(logging.DEBUG)
@@ -496,3 +496,469 @@ logging.getLogger().setLevel(logging.ERROR)
 asyncio.run(main_async())
 
 logging.getLogger().setLevel(logging.DEBUG)
+
+
+print("Example 30")
+class ProtocolServerSession(asyncio.Protocol):
+    def __init__(self):
+        self.transport = None
+        self.buffer = bytearray()
+        self.clear_state()
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def data_received(self, data):
+        # Split lines straight out of the received bytes instead of
+        # copying them through a StreamReader first
+        self.buffer += data
+        start = 0
+        while (end := self.buffer.find(b"\n", start)) != -1:
+            command = self.buffer[start:end].decode()
+            start = end + 1
+            self.handle(command)
+        del self.buffer[:start]
+
+    def send(self, command):
+        self.transport.write(command.encode() + b"\n")
+
+    def handle(self, command):
+        match command.split(" "):
+            case "PARAMS", lower, upper:
+                self.set_params(lower, upper)
+            case ["NUMBER"]:
+                self.send_number()
+            case "REPORT", decision:
+                self.receive_report(decision)
+            case ["CLEAR"]:
+                self.clear_state()
+            case _:
+                raise UnknownCommandError(command)
+
+    # The game logic doesn't depend on how bytes are read and written
+    set_params = ServerSession.set_params
+    next_guess = ServerSession.next_guess
+    send_number = ServerSession.send_number
+    receive_report = ServerSession.receive_report
+    clear_state = ServerSession.clear_state
+
+
+print("Example 31")
+async def run_protocol_server(address):
+    loop = asyncio.get_running_loop()
+    server = await loop.create_server(ProtocolServerSession, *address)
+    async with server:
+        await server.serve_forever()
+
+async def main_protocol():
+    address = ("127.0.0.1", 4322)
+
+    server = run_protocol_server(address)
+    asyncio.create_task(server)
+
+    results = await run_async_client(address)
+    for number, outcome in results:
+        print(f"Client: {number} is {outcome}")
+
+logging.getLogger().setLevel(logging.ERROR)
+
+asyncio.run(main_protocol())
+
+logging.getLogger().setLevel(logging.DEBUG)
+
+
+print("Example 32")
+class QuietReportMixin:
+    # The same as receive_report without printing, for load testing
+    def receive_report(self, decision):
+        last = self.guesses[-1]
+        if decision == CORRECT:
+            self.secret = last
+
+class QuietServerSession(QuietReportMixin, ServerSession):
+    pass
+
+class QuietAsyncServerSession(QuietReportMixin, AsyncServerSession):
+    pass
+
+class QuietProtocolServerSession(QuietReportMixin, ProtocolServerSession):
+    pass
+
+
+from threading import Event
+
+# asyncio calls listen() again on the socket with its own default
+# backlog of 100, which would drop connections when they arrive at once
+BACKLOG = 1024
+
+def start_threaded_server(listener, ready):
+    def handle(connection):
+        with connection:
+            session = QuietServerSession(connection)
+            try:
+                session.loop()
+            except EOFError:
+                pass
+
+    def serve():
+        ready.set()
+        while True:
+            connection, _ = listener.accept()
+            Thread(target=handle, args=(connection,), daemon=True).start()
+
+    Thread(target=serve, daemon=True).start()
+
+def start_streams_server(listener, ready):
+    async def handle(reader, writer):
+        session = QuietAsyncServerSession(reader, writer)
+        try:
+            await session.loop()
+        except EOFError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve():
+        server = await asyncio.start_server(
+            handle, sock=listener, backlog=BACKLOG
+        )
+        ready.set()
+        async with server:
+            await server.serve_forever()
+
+    Thread(target=asyncio.run, args=(serve(),), daemon=True).start()
+
+def start_protocol_server(listener, ready):
+    async def serve():
+        loop = asyncio.get_running_loop()
+        server = await loop.create_server(
+            QuietProtocolServerSession, sock=listener, backlog=BACKLOG
+        )
+        ready.set()
+        async with server:
+            await server.serve_forever()
+
+    Thread(target=asyncio.run, args=(serve(),), daemon=True).start()
+
+
+print("Example 33")
+import os
+import statistics
+
+def current_rss():
+    # Resident set size in KiB; this is Linux-specific
+    with open("/proc/self/statm") as f:
+        resident_pages = int(f.read().split()[1])
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") / 1024
+
+class TimedAsyncClientSession(AsyncClientSession):
+    def __init__(self, *args, latencies):
+        super().__init__(*args)
+        self.latencies = latencies
+
+    async def request_number(self):
+        start = time.perf_counter()
+        number = await super().request_number()
+        end = time.perf_counter()
+        self.latencies.append(end - start)
+        return number
+
+async def play_games(streams, games, latencies):
+    connection = AsyncConnection(*streams)
+
+    for _ in range(games):
+        secret = random.randint(1, 20)
+        await connection.send("PARAMS 1 20")
+        session = TimedAsyncClientSession(
+            connection.send,
+            connection.receive,
+            secret,
+            latencies=latencies,
+        )
+        async for _ in session:
+            pass
+        await connection.send("CLEAR")
+
+    _, writer = streams
+    writer.close()
+    await writer.wait_closed()
+
+async def generate_load(address, connections, games):
+    rss_before = current_rss()
+
+    start = time.perf_counter()
+    all_streams = await asyncio.gather(
+        *(asyncio.open_connection(*address) for _ in range(connections))
+    )
+    end = time.perf_counter()
+    connect_delta = end - start
+
+    # Give the server a moment to set up a session for every connection
+    await asyncio.sleep(0.1)
+    rss_growth = current_rss() - rss_before
+
+    latencies = []
+    await asyncio.gather(
+        *(play_games(streams, games, latencies) for streams in all_streams)
+    )
+    return connect_delta, rss_growth, latencies
+
+def benchmark_server(name, start_server, connections, games):
+    listener = socket.create_server(("127.0.0.1", 0), backlog=BACKLOG)
+    address = listener.getsockname()
+    ready = Event()
+    start_server(listener, ready)
+    ready.wait()  # Connections beyond the backlog would be retried
+
+    connect_delta, rss_growth, latencies = asyncio.run(
+        generate_load(address, connections, games)
+    )
+
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"{name:>8}: {connections / connect_delta:,.0f} connections/s, "
+        f"p50={percentiles[49] * 1e6:,.0f}us "
+        f"p99={percentiles[98] * 1e6:,.0f}us, "
+        # This includes the client side, since it runs in this process
+        f"{rss_growth / connections:,.1f} KiB RSS/connection"
+    )
+
+
+benchmark_server("threaded", start_threaded_server, 500, 3)
+benchmark_server("streams", start_streams_server, 500, 3)
+benchmark_server("protocol", start_protocol_server, 500, 3)
+
+
+print("Example 34")
+from collections import deque
+
+class CountingAsyncConnection(AsyncConnection):
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.write_count = 0
+
+    async def send(self, command):
+        self.write_count += 1
+        await super().send(command)
+
+    async def flush(self):
+        pass  # Every send already wrote and drained
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+class BatchedAsyncConnection(AsyncConnection):
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.pending = []
+        self.write_count = 0
+
+    async def send(self, command):
+        self.pending.append(command + "\n")
+
+    async def flush(self):
+        if not self.pending:
+            return
+        data = "".join(self.pending).encode()
+        self.pending.clear()
+        self.writer.write(data)  # One write and one drain for all lines
+        self.write_count += 1
+        await self.writer.drain()
+
+    async def receive(self):
+        await self.flush()  # The reply may depend on what's pending
+        return await super().receive()
+
+    async def close(self):
+        await self.flush()
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+print("Example 35")
+class PipelinedAsyncConnection:
+    def __init__(self, reader, writer):
+        self.connection = BatchedAsyncConnection(reader, writer)
+        self.responses = deque()
+        self.error = None
+        self.reader_task = asyncio.create_task(self.read_responses())
+
+    @property
+    def write_count(self):
+        return self.connection.write_count
+
+    async def send(self, command):
+        await self.connection.send(command)
+
+    async def flush(self):
+        await self.connection.flush()
+
+    async def request(self, command):
+        if self.reader_task.done():
+            # Nothing would ever answer, so don't hand out a future
+            raise self.error
+        # Responses arrive in the same order the commands were sent
+        future = asyncio.get_running_loop().create_future()
+        self.responses.append(future)
+        await self.connection.send(command)
+        return future
+
+    async def read_responses(self):
+        try:
+            while line := await self.connection.reader.readline():
+                if not self.responses:
+                    raise ValueError(f"Unexpected response: {line!r}")
+                self.responses.popleft().set_result(line[:-1].decode())
+            self.error = EOFError("Connection closed")
+        except asyncio.CancelledError:
+            self.error = EOFError("Connection closed")
+            raise
+        except Exception as e:
+            self.error = e
+        finally:
+            while self.responses:
+                future = self.responses.popleft()
+                if not future.done():
+                    future.set_exception(self.error)
+
+    async def close(self):
+        self.reader_task.cancel()
+        try:
+            await self.reader_task
+        except asyncio.CancelledError:
+            pass
+        await self.connection.close()
+
+
+class PipelinedClientSession(AsyncClientSession):
+    def __init__(self, connection, secret):
+        super().__init__(connection.send, None, secret)
+        self.connection = connection
+
+    async def __aiter__(self):
+        pending = await self.connection.request("NUMBER")
+        await self.connection.flush()
+
+        while True:
+            number = int(await pending)
+            decision = await self.report_outcome(number)
+            if decision != CORRECT:
+                # Ask for the next number before handing this outcome
+                # to the caller, so the round trip overlaps their work
+                pending = await self.connection.request("NUMBER")
+            await self.connection.flush()
+
+            yield number, decision
+            if decision == CORRECT:
+                return
+
+
+print("Example 36")
+async def forward_with_latency(reader, writer, delay):
+    loop = asyncio.get_running_loop()
+    # Deliver each chunk after the delay without holding up the chunks
+    # behind it, like a long network link would
+    while data := await reader.read(65536):
+        loop.call_later(delay, writer.write, data)
+    loop.call_later(delay, writer.close)
+
+async def start_latency_proxy(target, delay):
+    async def handle(client_reader, client_writer):
+        server_reader, server_writer = await asyncio.open_connection(
+            *target
+        )
+        await asyncio.gather(
+            forward_with_latency(client_reader, server_writer, delay),
+            forward_with_latency(server_reader, client_writer, delay),
+        )
+
+    proxy = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return proxy, proxy.sockets[0].getsockname()
+
+
+def new_plain_session(connection, secret):
+    return AsyncClientSession(connection.send, connection.receive, secret)
+
+async def play_with_latency(
+    target, delay, connection_class, new_session, secrets, work
+):
+    proxy, address = await start_latency_proxy(target, delay)
+    reader, writer = await asyncio.open_connection(*address)
+    connection = connection_class(reader, writer)
+
+    guesses = 0
+    start = time.perf_counter()
+    for secret in secrets:
+        await connection.send("PARAMS 1 20")
+        async for _ in new_session(connection, secret):
+            guesses += 1
+            await asyncio.sleep(work)  # Process each outcome
+        await connection.send("CLEAR")
+    await connection.flush()
+    end = time.perf_counter()
+
+    await connection.close()
+    proxy.close()
+    return guesses, end - start, connection.write_count
+
+
+listener = socket.create_server(("127.0.0.1", 0), backlog=BACKLOG)
+target = listener.getsockname()
+ready = Event()
+start_protocol_server(listener, ready)
+ready.wait()
+
+secrets = [random.randint(1, 20) for _ in range(10)]
+modes = [
+    ("unbatched", CountingAsyncConnection, new_plain_session),
+    ("batched", BatchedAsyncConnection, new_plain_session),
+    ("pipelined", PipelinedAsyncConnection, PipelinedClientSession),
+]
+
+for name, connection_class, new_session in modes:
+    guesses, delta, writes = asyncio.run(
+        play_with_latency(
+            target, 0.002, connection_class, new_session, secrets, 0.002
+        )
+    )
+    print(
+        f"{name:>9}: {delta / guesses * 1e3:.2f} ms/guess, "
+        f"{writes / guesses:.2f} writes/guess"
+    )
+
+
+async def check_pipeline_failure():
+    async def hang_up(reader, writer):
+        await reader.readline()
+        writer.close()  # Close without answering
+
+    server = await asyncio.start_server(hang_up, "127.0.0.1", 0)
+    address = server.sockets[0].getsockname()
+    connection = PipelinedAsyncConnection(
+        *await asyncio.open_connection(*address)
+    )
+
+    pending = await connection.request("NUMBER")
+    await connection.flush()
+    try:
+        await pending
+    except EOFError:
+        pass
+    else:
+        assert False
+
+    try:
+        await connection.request("NUMBER")
+    except EOFError:
+        pass
+    else:
+        assert False
+
+    await connection.close()
+    server.close()
+    await server.wait_closed()
+    print("Pending and later requests fail once the reader is gone")
+
+asyncio.run(check_pipeline_failure())
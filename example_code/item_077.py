@@ -303,3 +303,323 @@ run_threads(handles, 0.1, output_path)
 confirm_merge(input_paths, output_path)
 
 tmpdir.cleanup()
+
+
+print("Example 13")
+class StatWatcher:
+    def __init__(self, min_interval=0.001, max_interval=0.1):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+
+    async def wait(self, handle, known_size):
+        # Check the size with one syscall, backing off exponentially
+        # while the file stays idle
+        interval = self.min_interval
+        while not handle.closed:
+            try:
+                if os.fstat(handle.fileno()).st_size > known_size:
+                    return
+            except ValueError:
+                return  # Closed by another thread
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, self.max_interval)
+
+    def unwatch(self, path):
+        pass
+
+    def close(self):
+        pass
+
+
+print("Example 14")
+import ctypes
+import struct
+import sys
+
+IN_MODIFY = 0x00000002
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+class InotifyWatcher:
+    def __init__(self, loop, max_interval=0.1):
+        self.loop = loop
+        self.max_interval = max_interval
+        libc = ctypes.CDLL(None, use_errno=True)
+        self.add_watch = libc.inotify_add_watch
+        self.add_watch.argtypes = [
+            ctypes.c_int,
+            ctypes.c_char_p,
+            ctypes.c_uint32,
+        ]
+        self.rm_watch = libc.inotify_rm_watch
+        self.rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+        self.watches = {}  # Path to watch descriptor
+        self.waiters = collections.defaultdict(set)
+        # Events are only ever delivered through this one loop
+        self.loop.add_reader(self.fd, self.read_events)
+
+    def watch(self, path):
+        wd = self.watches.get(path)
+        if wd is None:
+            wd = self.add_watch(self.fd, os.fsencode(path), IN_MODIFY)
+            if wd < 0:
+                error = ctypes.get_errno()
+                raise OSError(error, os.strerror(error), path)
+            self.watches[path] = wd
+        return wd
+
+    def unwatch(self, path):
+        wd = self.watches.pop(path, None)
+        if wd is None:
+            return
+        # Hard links to the same file share one watch descriptor
+        if wd not in self.watches.values():
+            self.rm_watch(self.fd, wd)
+            self.waiters.pop(wd, None)
+
+    def read_events(self):
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        offset = 0
+        while offset < len(data):
+            wd, _, _, name_length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size + name_length
+            for event in self.waiters.get(wd, ()):
+                event.set()
+
+    async def wait(self, handle, known_size):
+        if asyncio.get_running_loop() is not self.loop:
+            raise RuntimeError("InotifyWatcher used from another loop")
+        wd = self.watch(handle.name)
+        event = asyncio.Event()
+        self.waiters[wd].add(event)
+        try:
+            while not handle.closed:
+                try:
+                    if os.fstat(handle.fileno()).st_size > known_size:
+                        return
+                except ValueError:
+                    return  # Closed by another thread
+                # Wake up periodically anyway to notice being closed
+                try:
+                    await asyncio.wait_for(event.wait(), self.max_interval)
+                except TimeoutError:
+                    pass
+                event.clear()
+        finally:
+            self.waiters[wd].discard(event)
+
+    def close(self):
+        for path in list(self.watches):
+            self.unwatch(path)
+        if not self.loop.is_closed():
+            self.loop.remove_reader(self.fd)
+        os.close(self.fd)
+
+
+def new_watcher():
+    if sys.platform == "linux":
+        try:
+            return InotifyWatcher(asyncio.get_running_loop())
+        except (OSError, AttributeError):
+            pass
+    return StatWatcher()
+
+
+print("Example 15")
+async def tail_events(handle, watcher, write_func):
+    loop = asyncio.get_event_loop()
+    pending = b""
+    size = handle.tell()  # The handle may start past the beginning
+
+    try:
+        while not handle.closed:
+            try:
+                # Read everything available at once instead of seeking
+                # around to check for each new line
+                data = await loop.run_in_executor(None, handle.read)
+            except ValueError:
+                break  # Closed by another thread
+            if not data:
+                await watcher.wait(handle, size)
+                continue
+
+            size += len(data)
+            *lines, pending = (pending + data).split(b"\n")
+            for line in lines:
+                await write_func(line + b"\n")
+    finally:
+        watcher.unwatch(handle.name)
+
+async def run_tasks_events(handles, output_path):
+    loop = asyncio.get_event_loop()
+    watcher = new_watcher()
+
+    output = await loop.run_in_executor(None, open, output_path, "wb")
+    try:
+
+        async def write_async(data):
+            await loop.run_in_executor(None, output.write, data)
+
+        async with asyncio.TaskGroup() as group:
+            for handle in handles:
+                group.create_task(
+                    tail_events(handle, watcher, write_async)
+                )
+    finally:
+        watcher.close()
+        await loop.run_in_executor(None, output.close)
+
+
+input_paths = ...
+handles = ...
+output_path = ...
+
+tmpdir, input_paths, handles, output_path = setup()
+
+asyncio.run(run_tasks_events(handles, output_path))
+
+confirm_merge(input_paths, output_path)
+
+tmpdir.cleanup()
+
+
+print("Example 16")
+import statistics
+
+def write_timed_data(path, write_count, interval):
+    with open(path, "ab") as f:
+        for _ in range(write_count):
+            time.sleep(random.random() * interval)
+            f.write(f"{time.perf_counter()}\n".encode())
+            f.flush()
+
+def benchmark_tail(
+    name, tail_func, file_count, active_count, watcher_factory=None
+):
+    latencies = []
+
+    async def record(line):
+        latencies.append(time.perf_counter() - float(line))
+
+    with TemporaryDirectory() as tmpdir:
+        handles = []
+        for i in range(file_count):
+            path = os.path.join(tmpdir, str(i))
+            open(path, "w").close()
+            handles.append(open(path, "rb"))
+
+        writers = []
+        for handle in handles[:active_count]:
+            args = (handle.name, 20, 0.05)
+            writers.append(Thread(target=write_timed_data, args=args))
+
+        async def run():
+            # Watchers belong to the loop that's running the tailers
+            watcher = watcher_factory() if watcher_factory else None
+            try:
+                async with asyncio.TaskGroup() as group:
+                    for handle in handles:
+                        task = tail_func(handle, record, watcher)
+                        group.create_task(task)
+                    for thread in writers:
+                        thread.start()
+                    await asyncio.sleep(1.5)
+                    for handle in handles:
+                        handle.close()
+                # Every tailer removes its watch when it finishes
+                assert not getattr(watcher, "watches", None)
+            finally:
+                if watcher:
+                    watcher.close()
+
+        start = time.process_time()
+        asyncio.run(run())
+        end = time.process_time()
+
+        for thread in writers:
+            thread.join()
+
+    assert len(latencies) == 20 * active_count
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"{name:>8}: {end - start:.3f} CPU seconds, "
+        f"p50={percentiles[49] * 1e3:.1f}ms "
+        f"p99={percentiles[98] * 1e3:.1f}ms"
+    )
+
+
+def tail_polling(handle, write_func, watcher):
+    return tail_async(handle, 0.01, write_func)
+
+def tail_watched(handle, write_func, watcher):
+    return tail_events(handle, watcher, write_func)
+
+def new_inotify_watcher():
+    return InotifyWatcher(asyncio.get_running_loop())
+
+
+benchmark_tail("polling", tail_polling, 200, 5)
+benchmark_tail("stat", tail_watched, 200, 5, StatWatcher)
+if sys.platform == "linux":
+    benchmark_tail("inotify", tail_watched, 200, 5, new_inotify_watcher)
+
+
+print("Example 17")
+class CountingHandle:
+    def __init__(self, handle):
+        self.handle = handle
+        self.read_count = 0
+
+    def read(self):
+        self.read_count += 1
+        return self.handle.read()
+
+    def __getattr__(self, name):
+        return getattr(self.handle, name)
+
+async def tail_from_end(path, watcher_factory):
+    lines = []
+
+    async def record(line):
+        lines.append(line)
+
+    with open(path, "rb") as f:
+        f.seek(0, 2)  # Only new lines, like tail -f
+        handle = CountingHandle(f)
+        watcher = watcher_factory()
+        task = asyncio.create_task(tail_events(handle, watcher, record))
+        await asyncio.sleep(0.5)  # Idle file
+
+        with open(path, "ab") as output:
+            output.write(b"new line\n")
+        await asyncio.sleep(0.2)
+
+        f.close()
+        await task
+        watcher.close()
+
+    return lines, handle.read_count
+
+
+with TemporaryDirectory() as tmpdir:
+    path = os.path.join(tmpdir, "log")
+    with open(path, "wb") as f:
+        f.write(b"old line\n" * 100)
+
+    for name, factory in [
+        ("stat", StatWatcher),
+        ("inotify", new_watcher),
+    ]:
+        lines, read_count = asyncio.run(tail_from_end(path, factory))
+        assert lines == [b"new line\n"], lines
+        assert read_count < 50  # No spinning while the file is idle
+        print(f"{name:>8}: tailed {len(lines)} new line from the end "
+              f"with {read_count} reads")
+        with open(path, "ab") as f:
+            f.truncate(900)  # Drop the new line for the next run
@@ -260,3 +260,228 @@ asyncio.run(run_fully_async(handles, 0.1, output_path))
 confirm_merge(input_paths, output_path)
 
 tmpdir.cleanup()
+
+
+print("Example 11")
+class BufferedMergeWriter:
+    def __init__(
+        self,
+        output_path,
+        max_lines=10_000,
+        flush_bytes=1024 * 1024,
+        flush_interval=0.05,
+    ):
+        self.output_path = output_path
+        self.max_lines = max_lines
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+        self.output = None
+        self.lines = collections.deque()
+        self.size = 0
+        self.flushing = 0
+        self.space = asyncio.Condition()
+        self.flush_needed = asyncio.Event()
+        self.flusher = None
+        self.closing = False
+        self.error = None
+
+    def has_space(self):
+        # Lines that are still being written out count against the
+        # limit too, so no more than max_lines are ever held in memory
+        return len(self.lines) + self.flushing < self.max_lines
+
+    async def write(self, data):
+        async with self.space:
+            # Make the tailers wait while the buffer is full
+            await self.space.wait_for(
+                lambda: self.error is not None or self.has_space()
+            )
+            if self.error is not None:
+                raise self.error
+            self.lines.append(data)
+            self.size += len(data)
+            # Start flushing at half the limit, so the tailers can keep
+            # filling the other half while the batch is written
+            if self.size >= self.flush_bytes:
+                self.flush_needed.set()
+            elif len(self.lines) >= self.max_lines // 2:
+                self.flush_needed.set()
+
+    async def flush(self):
+        batch = self.lines
+        self.lines = collections.deque()
+        self.size = 0
+        self.flush_needed.clear()
+
+        if batch:
+            self.flushing = len(batch)
+            loop = asyncio.get_running_loop()
+            try:
+                # One trip to the thread pool for the whole batch
+                await loop.run_in_executor(
+                    None, self.output.writelines, batch
+                )
+            finally:
+                self.flushing = 0
+
+        async with self.space:
+            self.space.notify_all()
+
+    async def flush_forever(self):
+        try:
+            while not self.closing:
+                try:
+                    await asyncio.wait_for(
+                        self.flush_needed.wait(), self.flush_interval
+                    )
+                except TimeoutError:
+                    pass
+                await self.flush()
+        except Exception as e:
+            # Wake up the blocked tailers so they see the error instead
+            # of waiting for space that will never free up
+            self.error = e
+            async with self.space:
+                self.space.notify_all()
+            raise
+
+    async def __aenter__(self):
+        loop = asyncio.get_running_loop()
+        self.output = await loop.run_in_executor(
+            None, open, self.output_path, "wb"
+        )
+        self.flusher = asyncio.create_task(self.flush_forever())
+        return self
+
+    async def __aexit__(self, *_):
+        # Let any write that's in progress finish instead of cancelling
+        # it, so the last flush can't overlap with it
+        self.closing = True
+        self.flush_needed.set()
+        loop = asyncio.get_running_loop()
+        try:
+            await self.flusher
+            await self.flush()
+        finally:
+            await loop.run_in_executor(None, self.output.close)
+
+
+async def run_buffered(handles, interval, output_path):
+    async with (
+        BufferedMergeWriter(output_path) as output,
+        asyncio.TaskGroup() as group,
+    ):
+        for handle in handles:
+            group.create_task(
+                tail_async(handle, interval, output.write)
+            )
+
+
+tmpdir, input_paths, handles, output_path = setup()
+
+asyncio.run(run_buffered(handles, 0.1, output_path))
+
+confirm_merge(input_paths, output_path)
+
+tmpdir.cleanup()
+
+
+class FailingOutput:
+    def writelines(self, lines):
+        raise OSError("Disk full")
+
+    def close(self):
+        pass
+
+async def run_failing(handles, interval, output_path):
+    async with (
+        BufferedMergeWriter(output_path, max_lines=10) as output,
+        asyncio.TaskGroup() as group,
+    ):
+        output.output.close()
+        output.output = FailingOutput()
+        for handle in handles:
+            group.create_task(
+                tail_async(handle, interval, output.write)
+            )
+
+
+tmpdir, input_paths, handles, output_path = setup()
+
+try:
+    asyncio.run(run_failing(handles, 0.1, output_path))
+except* OSError as e:
+    print(f"Merge stopped: {e.exceptions[0]}")
+else:
+    assert False
+
+for handle in handles:
+    handle.close()
+tmpdir.cleanup()
+
+
+print("Example 12")
+def random_lines(path, count):
+    lines = []
+    for i in range(count):
+        letters = random.choices(string.ascii_lowercase, k=100)
+        lines.append(f'{path}-{i:06}-{"".join(letters)}\n'.encode())
+    return lines
+
+async def produce(lines, write_func):
+    for line in lines:
+        await write_func(line)
+
+async def run_per_line(all_lines, output_path):
+    loop = asyncio.get_event_loop()
+    output = await loop.run_in_executor(None, open, output_path, "wb")
+    try:
+
+        async def write_async(data):
+            await loop.run_in_executor(None, output.write, data)
+
+        async with asyncio.TaskGroup() as group:
+            for lines in all_lines:
+                group.create_task(produce(lines, write_async))
+    finally:
+        await loop.run_in_executor(None, output.close)
+
+async def run_write_thread(all_lines, output_path):
+    async with (
+        WriteThread(output_path) as output,
+        asyncio.TaskGroup() as group,
+    ):
+        for lines in all_lines:
+            group.create_task(produce(lines, output.write))
+
+async def run_batched(all_lines, output_path):
+    async with (
+        BufferedMergeWriter(output_path) as output,
+        asyncio.TaskGroup() as group,
+    ):
+        for lines in all_lines:
+            group.create_task(produce(lines, output.write))
+
+def benchmark_sink(name, run_func, lines_per_file):
+    with TemporaryDirectory() as tmpdir:
+        all_lines = [
+            random_lines(f"input{i}", lines_per_file) for i in range(5)
+        ]
+        total = sum(len(line) for lines in all_lines for line in lines)
+        output_path = os.path.join(tmpdir, "merged")
+
+        start = time.perf_counter()
+        asyncio.run(run_func(all_lines, output_path))
+        end = time.perf_counter()
+
+        assert os.path.getsize(output_path) == total
+    print(
+        f"{name:>12}: {5 * lines_per_file:,} lines at "
+        f"{total / (end - start) / 1e6:.1f} MB/s"
+    )
+
+
+benchmark_sink("per-line", run_per_line, 2_000)
+benchmark_sink("WriteThread", run_write_thread, 2_000)
+benchmark_sink("batched", run_batched, 2_000)
+benchmark_sink("batched", run_batched, 50_000)
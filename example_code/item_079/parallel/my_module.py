@@ -14,6 +14,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import Counter
+from math import isqrt
+import random
+
+# Private generator so callers' seeded global stream is left untouched
+_rng = random.Random()
+
 def gcd(pair):
     a, b = pair
     low = min(a, b)
@@ -21,3 +28,112 @@ def gcd(pair):
         if a % i == 0 and b % i == 0:
             return i
     raise RuntimeError("Not reachable")
+
+def factorize(number):
+    for i in range(1, number + 1):
+        if number % i == 0:
+            yield i
+
+def gcd_euclid(pair):
+    a, b = pair
+    while b:
+        a, b = b, a % b
+    return a
+
+def gcd_binary(pair):
+    a, b = pair
+    if a == 0 or b == 0:
+        return a | b
+    # Factor out the powers of two shared by both numbers
+    shift = ((a | b) & -(a | b)).bit_length() - 1
+    a >>= (a & -a).bit_length() - 1
+    while b:
+        b >>= (b & -b).bit_length() - 1
+        if a > b:
+            a, b = b, a
+        b -= a
+    return a << shift
+
+GCD_IMPLEMENTATIONS = {
+    "countdown": gcd,
+    "euclid": gcd_euclid,
+    "binary": gcd_binary,
+}
+
+def is_prime(number):
+    if number < 2:
+        return False
+    for prime in (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37):
+        if number % prime == 0:
+            return number == prime
+
+    # Miller-Rabin with these bases is exact below 3.3 * 10**24
+    d = number - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for base in (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37):
+        x = pow(base, d, number)
+        if x == 1 or x == number - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % number
+            if x == number - 1:
+                break
+        else:
+            return False
+    return True
+
+def pollard_rho(number):
+    if number % 2 == 0:
+        return 2
+    while True:
+        c = _rng.randrange(1, number)
+        x = y = _rng.randrange(2, number)
+        divisor = 1
+        while divisor == 1:
+            x = (x * x + c) % number
+            y = (y * y + c) % number
+            y = (y * y + c) % number
+            divisor = gcd_euclid((abs(x - y), number))
+        if divisor != number:
+            return divisor
+
+def prime_factors(number, trial_limit=1000):
+    factors = []
+    candidate = 2
+    limit = min(isqrt(number), trial_limit)
+    while candidate <= limit:
+        while number % candidate == 0:
+            factors.append(candidate)
+            number //= candidate
+        candidate += 1 if candidate == 2 else 2
+
+    # Whatever is left has no small factors, so split it up randomly
+    remaining = [number] if number > 1 else []
+    while remaining:
+        number = remaining.pop()
+        if is_prime(number):
+            factors.append(number)
+        else:
+            divisor = pollard_rho(number)
+            remaining.extend([divisor, number // divisor])
+    return factors
+
+def factorize_fast(number):
+    if number < 1:
+        return
+    divisors = [1]
+    for prime, exponent in Counter(prime_factors(number)).items():
+        divisors = [
+            divisor * prime**power
+            for divisor in divisors
+            for power in range(exponent + 1)
+        ]
+    yield from sorted(divisors)
+
+FACTORIZE_IMPLEMENTATIONS = {
+    "trial": factorize,
+    "rho": factorize_fast,
+}
@@ -0,0 +1,83 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import my_module
+import random
+import time
+
+def time_each(func, items):
+    start = time.perf_counter()
+    results = [func(item) for item in items]
+    end = time.perf_counter()
+    return results, (end - start) / len(items)
+
+def compare(label, implementations, magnitudes, make_item, slow_limit):
+    baseline, *_ = implementations
+    for magnitude in magnitudes:
+        items = [make_item(magnitude) for _ in range(5)]
+        timings = {}
+        expected = None
+        for name, func in implementations.items():
+            if magnitude > slow_limit and name == baseline:
+                continue  # Far too slow to wait for
+            results, timings[name] = time_each(func, items)
+            if expected is None:
+                expected = results
+            assert results == expected, (name, items)
+
+        line = ", ".join(
+            f"{name} {seconds * 1e6:,.1f}us"
+            for name, seconds in timings.items()
+        )
+        if baseline in timings:
+            speedup = timings[baseline] / min(timings.values())
+            line += f" ({speedup:,.0f}x speedup)"
+        print(f"{label} 10**{magnitude}: {line}")
+
+def random_pair(magnitude):
+    return (
+        random.randrange(10 ** (magnitude - 1), 10**magnitude),
+        random.randrange(10 ** (magnitude - 1), 10**magnitude),
+    )
+
+def random_number(magnitude):
+    return random.randrange(10 ** (magnitude - 1), 10**magnitude)
+
+def factors(func):
+    return lambda number: list(func(number))
+
+def main():
+    random.seed(1234)
+    compare(
+        "gcd",
+        my_module.GCD_IMPLEMENTATIONS,
+        [3, 4, 5, 6, 12, 18],
+        random_pair,
+        slow_limit=6,
+    )
+    compare(
+        "factorize",
+        {
+            name: factors(func)
+            for name, func in my_module.FACTORIZE_IMPLEMENTATIONS.items()
+        },
+        [3, 4, 5, 6, 12, 18],
+        random_number,
+        slow_limit=6,
+    )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import my_module
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import time
+from warm_pool import WarmPool
+
+NUMBERS = [
+    (19633090, 22659730),
+    (20306770, 38141720),
+    (15516450, 22296200),
+    (20390450, 20208020),
+    (18237120, 19249280),
+    (22931290, 10204910),
+    (12812380, 22737820),
+    (38238120, 42372810),
+    (38127410, 47291390),
+    (12923910, 21238110),
+]
+
+# Shrink each pair so that thousands of them finish quickly, which
+# makes the per-task overhead show up in the timings
+SMALL_NUMBERS = [(a // 10_000, b // 10_000) for a, b in NUMBERS]
+
+def factors(number):
+    return list(my_module.factorize(number))
+
+def run_serial(func, items):
+    return list(map(func, items))
+
+def run_threads(func, items):
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        return list(pool.map(func, items))
+
+def run_processes(func, items):
+    with ProcessPoolExecutor(max_workers=8) as pool:
+        return list(pool.map(func, items))
+
+def compare(name, func, items, warm_pool):
+    expected = None
+    for mode, run in [
+        ("serial", run_serial),
+        ("threads", run_threads),
+        ("processes", run_processes),
+        ("warm chunked", warm_pool.map),
+    ]:
+        start = time.perf_counter()
+        results = run(func, items)
+        end = time.perf_counter()
+        if expected is None:
+            expected = results
+        assert results == expected
+        print(f"{name} {mode:>12}: {end - start:.3f} seconds")
+
+def main():
+    with WarmPool(max_workers=8) as warm_pool:
+        for scale in (10, 100, 1000):
+            items = SMALL_NUMBERS * scale
+            compare(f"gcd {scale}x", my_module.gcd, items, warm_pool)
+
+        numbers = [7775876, 6694411, 5038540, 5426782] * 100
+        small_numbers = [number // 1000 for number in numbers]
+        compare("factorize 100x", factors, small_numbers, warm_pool)
+
+        streamed = sorted(warm_pool.imap_unordered(factors, small_numbers))
+        assert streamed == sorted(map(factors, small_numbers))
+
+        items = SMALL_NUMBERS * 1000
+        chunksize = warm_pool.choose_chunksize(my_module.gcd, items)
+        print(f"Chose a chunksize of {chunksize} for gcd 1000x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import os
+import time
+
+def run_chunk(func, chunk):
+    return [func(item) for item in chunk]
+
+class WarmPool:
+    def __init__(self, max_workers=None, target_seconds=0.01):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.target_seconds = target_seconds
+        # Keep the worker processes alive between calls so they
+        # only pay the startup and import costs once
+        self.pool = ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def measure(self, func, items):
+        if not items:
+            return 0
+        # Sample every call instead of caching per function, since the
+        # same function can be cheap for one input and slow for another
+        sample = items[: max(1, min(10, len(items) // 100))]
+        start = time.perf_counter()
+        for item in sample:
+            func(item)
+        end = time.perf_counter()
+        return (end - start) / len(sample)
+
+    def choose_chunksize(self, func, items):
+        cost = self.measure(func, items)
+        # Big enough that each chunk's work outweighs the pickling and
+        # IPC overhead, but small enough to give every worker a few
+        # chunks so they all finish at about the same time
+        by_cost = int(self.target_seconds / cost) if cost else len(items)
+        by_balance = len(items) // (self.max_workers * 4)
+        return max(1, min(by_cost, by_balance))
+
+    def split(self, func, items, chunksize):
+        items = list(items)
+        if chunksize is None:
+            chunksize = self.choose_chunksize(func, items)
+        for start in range(0, len(items), chunksize):
+            yield items[start : start + chunksize]
+
+    def map(self, func, items, chunksize=None):
+        futures = [
+            self.pool.submit(run_chunk, func, chunk)
+            for chunk in self.split(func, items, chunksize)
+        ]
+        results = []
+        for future in futures:
+            results.extend(future.result())
+        return results
+
+    def imap_unordered(self, func, items, chunksize=None):
+        futures = [
+            self.pool.submit(run_chunk, func, chunk)
+            for chunk in self.split(func, items, chunksize)
+        ]
+        for future in as_completed(futures):
+            yield from future.result()
+
+    def close(self):
+        self.pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
@@ -147,3 +147,188 @@ stats = Stats(profiler, stream=STDOUT)
 stats.strip_dirs()
 stats.sort_stats("cumulative")
 stats.print_callees()
+
+
+print("Example 12")
+import json
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+
+class SamplingProfiler:
+    def __init__(self, interval=0.01):
+        self.interval = interval
+        self.stacks = defaultdict(Counter)
+        self.sample_count = 0
+        self.sampling_time = 0
+        self.elapsed = 0
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.started = None
+
+    def start(self):
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.started = time.perf_counter()
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        self.thread.join()
+        self.elapsed += time.perf_counter() - self.started
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def run(self):
+        sampler_id = threading.get_ident()
+        while not self.stop_event.wait(self.interval):
+            start = time.perf_counter()
+            self.take_sample(sampler_id)
+            self.sampling_time += time.perf_counter() - start
+
+    def take_sample(self, sampler_id):
+        names = {t.ident: t.name for t in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == sampler_id:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                filename = os.path.basename(code.co_filename)
+                stack.append((code.co_name, filename, code.co_firstlineno))
+                frame = frame.f_back
+            stack.reverse()
+            thread_name = names.get(ident, str(ident))
+            self.stacks[thread_name][tuple(stack)] += 1
+        self.sample_count += 1
+
+
+print("Example 13")
+def format_frame(frame):
+    name, filename, line = frame
+    return f"{name} ({filename}:{line})"
+
+def folded_stacks(profiler):
+    lines = []
+    for thread_name, stacks in profiler.stacks.items():
+        for stack, count in stacks.items():
+            parts = [thread_name] + [format_frame(x) for x in stack]
+            lines.append(f"{';'.join(parts)} {count}")
+    return lines
+
+def speedscope_profile(profiler, name="profile"):
+    frames = []
+    frame_index = {}
+    profiles = []
+
+    for thread_name, stacks in profiler.stacks.items():
+        samples = []
+        weights = []
+        for stack, count in stacks.items():
+            indexes = []
+            for frame in stack:
+                if frame not in frame_index:
+                    frame_index[frame] = len(frames)
+                    func, filename, line = frame
+                    frames.append(
+                        dict(name=func, file=filename, line=line)
+                    )
+                indexes.append(frame_index[frame])
+            samples.append(indexes)
+            weights.append(count * profiler.interval)
+        profiles.append(
+            dict(
+                type="sampled",
+                name=thread_name,
+                unit="seconds",
+                startValue=0,
+                endValue=sum(weights),
+                samples=samples,
+                weights=weights,
+            )
+        )
+
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "shared": dict(frames=frames),
+        "profiles": profiles,
+        "name": name,
+        "exporter": "SamplingProfiler",
+    }
+
+def top_functions(profiler, limit=5):
+    totals = Counter()
+    for stacks in profiler.stacks.values():
+        for stack, count in stacks.items():
+            totals[format_frame(stack[-1])] += count
+    return totals.most_common(limit)
+
+
+print("Example 14")
+import statistics
+
+def run_program(repeat):
+    for _ in range(repeat):
+        my_program()
+
+def time_program():
+    start = time.perf_counter()
+    run_program(5)
+    end = time.perf_counter()
+    return end - start
+
+def compare_overhead(profiler, trials=7):
+    run_program(1)  # Warm up
+    baseline = []
+    profiled = []
+    # Alternate the runs so both see the same machine conditions
+    for _ in range(trials):
+        baseline.append(time_program())
+        profiler.start()
+        profiled.append(time_program())
+        profiler.stop()
+    return statistics.median(baseline), statistics.median(profiled)
+
+profiler = SamplingProfiler()
+baseline, profiled = compare_overhead(profiler)
+
+print(f"Took {baseline:.3f} seconds without profiler")
+print(f"Took {profiled:.3f} seconds with profiler")
+print(f"Overhead: {profiled / baseline - 1:.2%}")
+print(f"Collected {profiler.sample_count} samples, spending "
+      f"{profiler.sampling_time:.3f} seconds taking them")
+
+for function, count in top_functions(profiler):
+    print(f"{count:5d} {function}")
+
+
+print("Example 15")
+background = threading.Thread(
+    target=run_program, args=(3,), name="Background"
+)
+
+with SamplingProfiler() as profiler:
+    background.start()
+    insertion_sort(data)
+    background.join()
+
+with open("profile.folded", "w") as f:
+    for line in folded_stacks(profiler):
+        f.write(line + "\n")
+
+with open("profile.speedscope.json", "w") as f:
+    json.dump(speedscope_profile(profiler, name="my_program"), f)
+
+with open("profile.folded") as f:
+    folded = f.read().splitlines()
+
+print(f"Wrote {len(folded)} folded stacks")
+print(sorted(profiler.stacks))
+assert {"MainThread", "Background"} <= set(profiler.stacks)
+assert any("my_utility" in line for line in folded)
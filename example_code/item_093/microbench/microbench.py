@@ -0,0 +1,159 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import json
+import math
+import platform
+import random
+import statistics
+import timeit
+
+
+class Benchmark:
+    def __init__(self, name, func, args=(), self_timed=False):
+        self.name = name
+        self.func = func
+        self.args = args
+        # Self-timed functions run their own setup and return how many
+        # seconds the interesting part took, like the *_benchmark
+        # functions in the book examples
+        self.self_timed = self_timed
+
+    def run(self, number):
+        if self.self_timed:
+            total = sum(self.func(*self.args) for _ in range(number))
+        else:
+            timer = timeit.Timer(lambda: self.func(*self.args))
+            total = timer.timeit(number=number)
+        return total / number
+
+
+def discover(namespace, suffix="_benchmark"):
+    found = {}
+    for name, value in namespace.items():
+        if name.endswith(suffix) and callable(value):
+            found[name] = value
+    return found
+
+
+def calibrate(benchmark, min_time):
+    number = 1
+    while True:
+        delay = benchmark.run(number)
+        if delay * number >= min_time:
+            return number
+        number *= 2
+
+
+def collect(benchmark, repeat=15, min_time=0.02, warmup=1):
+    for _ in range(warmup):
+        benchmark.run(1)
+    number = calibrate(benchmark, min_time)
+    samples = [benchmark.run(number) for _ in range(repeat)]
+    return number, samples
+
+
+def reject_outliers(samples):
+    q1, _, q3 = statistics.quantiles(samples, n=4)
+    iqr = q3 - q1
+    low = q1 - 1.5 * iqr
+    high = q3 + 1.5 * iqr
+    return [x for x in samples if low <= x <= high]
+
+
+def bootstrap_median_ci(samples, confidence=0.95, resamples=1000):
+    rng = random.Random(1234)
+    medians = sorted(
+        statistics.median(rng.choices(samples, k=len(samples)))
+        for _ in range(resamples)
+    )
+    tail = (1 - confidence) / 2
+    low = medians[int(tail * resamples)]
+    high = medians[int((1 - tail) * resamples) - 1]
+    return low, high
+
+
+def summarize(samples):
+    kept = reject_outliers(samples)
+    q1, median, q3 = statistics.quantiles(kept, n=4)
+    ci_low, ci_high = bootstrap_median_ci(kept)
+    return dict(
+        median=statistics.median(kept),
+        q1=q1,
+        q3=q3,
+        iqr=q3 - q1,
+        ci_low=ci_low,
+        ci_high=ci_high,
+        rejected=len(samples) - len(kept),
+        samples=kept,
+    )
+
+
+def mann_whitney_p(before, after):
+    # Two-sided p-value using the normal approximation, which is
+    # reasonable for the 10+ samples collected per benchmark
+    combined = sorted(
+        [(x, 0) for x in before] + [(x, 1) for x in after]
+    )
+    ranks = [0.0] * len(combined)
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        i = j + 1
+
+    n1 = len(before)
+    n2 = len(after)
+    rank_sum = sum(r for r, (_, group) in zip(ranks, combined) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    mean = n1 * n2 / 2
+    stdev = math.sqrt(n1 * n2 * (n1 + n2 + 1) / 12)
+    if stdev == 0:
+        return 1.0
+    z = (u - mean) / stdev
+    return math.erfc(abs(z) / math.sqrt(2))
+
+
+def compare(baseline, current, threshold=0.05, alpha=0.01):
+    change = current["median"] / baseline["median"] - 1
+    p_value = mann_whitney_p(baseline["samples"], current["samples"])
+    if p_value < alpha and change > threshold:
+        status = "regression"
+    elif p_value < alpha and change < -threshold:
+        status = "improvement"
+    else:
+        status = "unchanged"
+    return dict(change=change, p_value=p_value, status=status)
+
+
+def save_results(path, results):
+    data = dict(
+        python=platform.python_version(),
+        implementation=platform.python_implementation(),
+        machine=platform.machine(),
+        results=results,
+    )
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)["results"]
@@ -0,0 +1,157 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import argparse
+import contextlib
+import io
+import os
+import runpy
+import sys
+
+import microbench
+
+EXAMPLES_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..")
+)
+
+SELF_TIMED_COUNT = 10_000
+
+
+def load_example(filename):
+    path = os.path.join(EXAMPLES_DIR, filename)
+    cwd = os.getcwd()
+    output = io.StringIO()
+    try:
+        # Each example script prints its output and switches into its
+        # own temporary directory, so hide the former and undo the latter
+        with contextlib.redirect_stdout(output):
+            with contextlib.redirect_stderr(output):
+                return runpy.run_path(path, run_name=filename)
+    finally:
+        os.chdir(cwd)
+
+
+def gather_benchmarks():
+    benchmarks = []
+
+    namespace = load_example("item_093.py")
+    numbers = list(range(10_000))
+    benchmarks.append(
+        microbench.Benchmark(
+            "item_093.loop_sum", namespace["loop_sum"], (numbers,)
+        )
+    )
+
+    namespace = load_example("item_099.py")
+    benchmarks.append(
+        microbench.Benchmark("item_099.run_test", namespace["run_test"])
+    )
+
+    namespace = load_example("item_102.py")
+    args = (namespace["data"], namespace["to_lookup"])
+    for name in ("run_linear", "run_bisect"):
+        benchmarks.append(
+            microbench.Benchmark(f"item_102.{name}", namespace[name], args)
+        )
+
+    for filename in ("item_103.py", "item_104.py"):
+        namespace = load_example(filename)
+        prefix = filename.removesuffix(".py")
+        found = microbench.discover(namespace)
+        for name, func in sorted(found.items()):
+            benchmarks.append(
+                microbench.Benchmark(
+                    f"{prefix}.{name}",
+                    func,
+                    (SELF_TIMED_COUNT,),
+                    self_timed=True,
+                )
+            )
+
+    return benchmarks
+
+
+def format_time(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e3), ("us", 1e6)):
+        if seconds * scale >= 1:
+            return f"{seconds * scale:.2f}{unit}"
+    return f"{seconds * 1e9:.2f}ns"
+
+
+def print_summary(name, number, summary):
+    print(
+        f"{name:<40} "
+        f"median {format_time(summary['median']):>9}  "
+        f"IQR {format_time(summary['iqr']):>9}  "
+        f"95% CI [{format_time(summary['ci_low'])}, "
+        f"{format_time(summary['ci_high'])}]  "
+        f"x{number} "
+        f"({summary['rejected']} outliers)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--save", help="Write results to a JSON file")
+    parser.add_argument("--baseline", help="Compare to a saved JSON file")
+    parser.add_argument("--filter", default="", help="Substring to match")
+    parser.add_argument("--repeat", type=int, default=15)
+    parser.add_argument("--min-time", type=float, default=0.02)
+    parser.add_argument("--threshold", type=float, default=0.05)
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        baseline = microbench.load_results(args.baseline)
+
+    results = {}
+    regressions = []
+    for benchmark in gather_benchmarks():
+        if args.filter not in benchmark.name:
+            continue
+
+        number, samples = microbench.collect(
+            benchmark, repeat=args.repeat, min_time=args.min_time
+        )
+        summary = microbench.summarize(samples)
+        summary["number"] = number
+        results[benchmark.name] = summary
+        print_summary(benchmark.name, number, summary)
+
+        if baseline and benchmark.name in baseline:
+            verdict = microbench.compare(
+                baseline[benchmark.name],
+                summary,
+                threshold=args.threshold,
+            )
+            print(
+                f"{'':<40} {verdict['status']}: "
+                f"{verdict['change']:+.1%} (p={verdict['p_value']:.4f})"
+            )
+            if verdict["status"] == "regression":
+                regressions.append(benchmark.name)
+
+    if args.save:
+        microbench.save_results(args.save, results)
+
+    if regressions:
+        print(f"Regressed: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -138,3 +138,224 @@ suite = unittest.defaultTestLoader.loadTestsFromTestCase(
 )
 # suite.debug()
 unittest.TextTestRunner(stream=STDOUT).run(suite)
+
+
+print("Example 9")
+from array import array
+
+class Py_buffer(ctypes.Structure):
+    _fields_ = [
+        ("buf", ctypes.c_void_p),
+        ("obj", ctypes.c_void_p),
+        ("len", ctypes.c_ssize_t),
+        ("itemsize", ctypes.c_ssize_t),
+        ("readonly", ctypes.c_int),
+        ("ndim", ctypes.c_int),
+        ("format", ctypes.c_char_p),
+        ("shape", ctypes.c_void_p),
+        ("strides", ctypes.c_void_p),
+        ("suboffsets", ctypes.c_void_p),
+        ("internal", ctypes.c_void_p),
+    ]
+
+get_buffer = ctypes.pythonapi.PyObject_GetBuffer
+get_buffer.restype = ctypes.c_int
+get_buffer.argtypes = (
+    ctypes.py_object,
+    ctypes.POINTER(Py_buffer),
+    ctypes.c_int,
+)
+release_buffer = ctypes.pythonapi.PyBuffer_Release
+release_buffer.restype = None
+release_buffer.argtypes = (ctypes.POINTER(Py_buffer),)
+
+PyBUF_SIMPLE = 0
+
+def buffer_address(view):
+    # Read-only buffers are fine here, unlike with from_buffer,
+    # because the address is only used to read the values
+    export = Py_buffer()
+    get_buffer(view, export, PyBUF_SIMPLE)
+    try:
+        return export.buf
+    finally:
+        release_buffer(export)
+
+class DotProductLibrary:
+    def __init__(self, library):
+        # Raw addresses avoid building ctypes objects on every call.
+        # Item access returns a new function object, so this doesn't
+        # change the argtypes that the earlier examples rely on
+        self.dot_product_func = library["dot_product"]
+        self.dot_product_func.restype = ctypes.c_double
+        self.dot_product_func.argtypes = (
+            ctypes.c_int,
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+        )
+
+        self.dot_products_func = library["dot_products"]
+        self.dot_products_func.restype = None
+        self.dot_products_func.argtypes = (
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+        )
+
+    def as_doubles(self, data):
+        if type(data) is array and data.typecode == "d":
+            # Always contiguous doubles; the caller keeps the array
+            # alive for the duration of the call
+            address, count = data.buffer_info()
+            return address, count, data
+        view = self.check_doubles(data)
+        count = view.nbytes // view.itemsize
+        if not count:
+            return None, 0, view
+        # Holding the memoryview pins the export, so the memory can't
+        # be resized or freed until the C function returns
+        return buffer_address(view), count, view
+
+    def check_doubles(self, data):
+        view = memoryview(data)
+        if view.format != "d" or view.itemsize != 8:
+            raise TypeError("Buffers must contain doubles")
+        if not view.c_contiguous:
+            raise TypeError("Buffers must be contiguous")
+        return view
+
+    def dot_product(self, a, b):
+        a_address, size, a_pin = self.as_doubles(a)
+        b_address, b_size, b_pin = self.as_doubles(b)
+        if b_size != size:
+            raise ValueError("Vectors must be the same length")
+        if not size:
+            return 0.0
+        return self.dot_product_func(size, a_address, b_address)
+
+    def dot_products(self, a, b, length):
+        a_address, size, a_pin = self.as_doubles(a)
+        b_address, b_size, b_pin = self.as_doubles(b)
+        if b_size != size:
+            raise ValueError("Vectors must be the same length")
+        if length <= 0 or size % length:
+            raise ValueError("Inputs must be a whole number of vectors")
+        count = size // length
+        if not count:
+            return array("d")
+        results = array("d", [0.0]) * count
+        self.dot_products_func(
+            count, length, a_address, b_address, results.buffer_info()[0]
+        )
+        return results
+
+
+fast_library = DotProductLibrary(my_library)
+a = array("d", [1.0, 2.5, 3.5])
+b = array("d", [-7, 4, -12.1])
+result = fast_library.dot_product(a, b)
+print(result)
+assert abs(result - -39.35) < 0.01
+
+a = array("d", [3, 4, 5, -1, -1, -1])
+b = array("d", [-1, 9, -2.5, 1, 1, 1])
+results = fast_library.dot_products(a, b, 3)
+print(results)
+assert list(results) == [20.5, -3.0]
+
+assert len(fast_library.dot_products(array("d"), array("d"), 3)) == 0
+
+try:
+    fast_library.dot_product(array("f", [1, 2, 3]), array("d", [1, 2, 3]))
+except TypeError as e:
+    print(e)
+else:
+    assert False
+
+try:
+    fast_library.dot_product(bytearray(8), array("d", [1]))
+except TypeError as e:
+    print(e)
+else:
+    assert False
+
+view = memoryview(array("d", [1, 2, 3, 4]))
+assert fast_library.dot_product(view[:2], view[2:]) == 11
+
+try:
+    fast_library.dot_product(view[::2], view[1::2])
+except TypeError as e:
+    print(e)
+else:
+    assert False
+
+# Inputs are only read, so read-only buffers work too
+read_only = memoryview(array("d", [1, 2, 3]).tobytes()).cast("d")
+assert read_only.readonly
+assert fast_library.dot_product(read_only, read_only) == 14
+results = fast_library.dot_products(read_only, read_only, 1)
+assert list(results) == [1, 4, 9]
+
+
+print("Example 10")
+import timeit
+
+def python_dot_product(a, b):
+    result = 0
+    for i, j in zip(a, b):
+        result += i * j
+    return result
+
+def measure(func, *args):
+    timer = timeit.Timer(lambda: func(*args))
+    number, delay = timer.autorange()
+    return delay / number
+
+def bulk_python(a_vectors, b_vectors):
+    return [python_dot_product(a, b) for a, b in zip(a_vectors, b_vectors)]
+
+original = measure(dot_product, [1.0, 2.5, 3.5], [-7, 4, -12.1])
+cached = measure(fast_library.dot_product, a[:3], b[:3])
+print(
+    f"Length 3: original wrapper {original * 1e6:.2f}us, "
+    f"cached wrapper {cached * 1e6:.2f}us"
+)
+
+pairs = 1000
+crossover = None
+
+for length in (1, 2, 3, 5, 10, 30, 100, 1000):
+    a_list = [float(i % 7) for i in range(length)]
+    b_list = [float(i % 5) for i in range(length)]
+    a_array = array("d", a_list)
+    b_array = array("d", b_list)
+    assert python_dot_product(a_list, b_list) == fast_library.dot_product(
+        a_array, b_array
+    )
+
+    python_time = measure(python_dot_product, a_list, b_list)
+    ctypes_time = measure(fast_library.dot_product, a_array, b_array)
+
+    a_vectors = [a_list] * pairs
+    b_vectors = [b_list] * pairs
+    a_flat = a_array * pairs
+    b_flat = b_array * pairs
+    bulk_python_time = measure(bulk_python, a_vectors, b_vectors) / pairs
+    bulk_time = (
+        measure(fast_library.dot_products, a_flat, b_flat, length) / pairs
+    )
+
+    if crossover is None and ctypes_time < python_time:
+        crossover = length
+
+    print(
+        f"Length {length:>4}: "
+        f"Python {python_time * 1e6:7.2f}us, "
+        f"ctypes {ctypes_time * 1e6:7.2f}us, "
+        f"per pair in bulk: Python {bulk_python_time * 1e6:7.2f}us, "
+        f"ctypes {bulk_time * 1e6:7.3f}us"
+    )
+
+print(f"Single ctypes calls win at length {crossover}")
@@ -24,3 +24,10 @@ double dot_product(int length, double* a, double* b) {
     }
     return result;
 }
+
+void dot_products(int count, int length, double* a, double* b,
+                  double* results) {
+    for (int i = 0; i < count; i++) {
+        results[i] = dot_product(length, a + i * length, b + i * length);
+    }
+}
@@ -15,3 +15,6 @@
  */
 
 extern double dot_product(int length, double* a, double* b);
+
+extern void dot_products(int count, int length, double* a, double* b,
+                         double* results);
@@ -48,5 +48,15 @@ int main(int argc, char** argv) {
         assert(fabs(found - expected) < 0.01);
     }
 
+    {
+        double a[] = {3, 4, 5, -1, -1, -1};
+        double b[] = {-1, 9, -2.5, 1, 1, 1};
+        double found[2];
+        dot_products(2, 3, a, b, found);
+        printf("Found %f, %f, Expected 20.5, -3\n", found[0], found[1]);
+        assert(fabs(found[0] - 20.5) < 0.01);
+        assert(fabs(found[1] - -3) < 0.01);
+    }
+
     return 0;
 }
@@ -0,0 +1,156 @@
+/*
+ * Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#include "my_extension3.h"
+
+static int is_double_format(const char *format)
+{
+    if (format == NULL) {
+        return 0;
+    }
+    if (format[0] == '@' || format[0] == '=') {
+        format++;
+    }
+    return strcmp(format, "d") == 0;
+}
+
+static int get_doubles(PyObject *obj, Py_buffer *view, int ndim)
+{
+    if (PyObject_GetBuffer(obj, view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT)) {
+        return -1;
+    }
+    if (!is_double_format(view->format) ||
+            view->itemsize != sizeof(double)) {
+        PyErr_SetString(PyExc_TypeError, "Buffers must contain doubles");
+        PyBuffer_Release(view);
+        return -1;
+    }
+    if (view->ndim != ndim) {
+        PyErr_Format(
+            PyExc_ValueError,
+            "Buffer must have %d dimension(s), not %d",
+            ndim,
+            view->ndim);
+        PyBuffer_Release(view);
+        return -1;
+    }
+    return 0;
+}
+
+static double multiply_add(
+    const double *left, const double *right, Py_ssize_t length)
+{
+    double result = 0;
+    for (Py_ssize_t i = 0; i < length; i++) {
+        result += left[i] * right[i];
+    }
+    return result;
+}
+
+PyObject *dot_product(PyObject *self, PyObject *args)
+{
+    PyObject *left, *right;
+    if (!PyArg_ParseTuple(args, "OO", &left, &right)) {
+        return NULL;
+    }
+
+    Py_buffer left_view, right_view;
+    if (get_doubles(left, &left_view, 1)) {
+        return NULL;
+    }
+    if (get_doubles(right, &right_view, 1)) {
+        PyBuffer_Release(&left_view);
+        return NULL;
+    }
+
+    PyObject *result = NULL;
+    if (left_view.shape[0] != right_view.shape[0]) {
+        PyErr_SetString(PyExc_ValueError, "Buffers must be the same length");
+    } else {
+        double total = multiply_add(
+            left_view.buf, right_view.buf, left_view.shape[0]);
+        result = PyFloat_FromDouble(total);
+    }
+
+    PyBuffer_Release(&left_view);
+    PyBuffer_Release(&right_view);
+    return result;
+}
+
+PyObject *dot_products(PyObject *self, PyObject *args)
+{
+    PyObject *matrix, *vector;
+    if (!PyArg_ParseTuple(args, "OO", &matrix, &vector)) {
+        return NULL;
+    }
+
+    Py_buffer matrix_view, vector_view;
+    if (get_doubles(matrix, &matrix_view, 2)) {
+        return NULL;
+    }
+    if (get_doubles(vector, &vector_view, 1)) {
+        PyBuffer_Release(&matrix_view);
+        return NULL;
+    }
+
+    Py_ssize_t rows = matrix_view.shape[0];
+    Py_ssize_t columns = matrix_view.shape[1];
+    PyObject *result = NULL;
+    double *totals = NULL;
+
+    if (columns != vector_view.shape[0]) {
+        PyErr_SetString(
+            PyExc_ValueError, "Matrix rows must match the vector length");
+        goto done;
+    }
+
+    totals = PyMem_New(double, rows ? rows : 1);
+    if (totals == NULL) {
+        PyErr_NoMemory();
+        goto done;
+    }
+
+    const double *matrix_data = matrix_view.buf;
+    const double *vector_data = vector_view.buf;
+
+    /* The buffers stay pinned until they are released below, and no
+     * Python objects are touched here, so other threads can run */
+    Py_BEGIN_ALLOW_THREADS
+    for (Py_ssize_t i = 0; i < rows; i++) {
+        totals[i] = multiply_add(
+            matrix_data + i * columns, vector_data, columns);
+    }
+    Py_END_ALLOW_THREADS
+
+    result = PyList_New(rows);
+    if (result == NULL) {
+        goto done;
+    }
+    for (Py_ssize_t i = 0; i < rows; i++) {
+        PyObject *item = PyFloat_FromDouble(totals[i]);
+        if (item == NULL) {
+            Py_CLEAR(result);
+            goto done;
+        }
+        PyList_SET_ITEM(result, i, item);
+    }
+
+done:
+    PyMem_Free(totals);
+    PyBuffer_Release(&matrix_view);
+    PyBuffer_Release(&vector_view);
+    return result;
+}
@@ -0,0 +1,52 @@
+/*
+ * Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#include "my_extension3.h"
+
+static PyMethodDef my_extension3_methods[] = {
+    {
+        "dot_product",
+        dot_product,
+        METH_VARARGS,
+        "Compute dot product",
+    },
+    {
+        "dot_products",
+        dot_products,
+        METH_VARARGS,
+        "Compute the dot product of each matrix row with a vector",
+    },
+    {
+        NULL,
+        NULL,
+        0,
+        NULL,
+    },
+};
+
+static struct PyModuleDef my_extension3 = {
+    PyModuleDef_HEAD_INIT,
+    "my_extension3",
+    "My third C-extension module",
+    -1,
+    my_extension3_methods,
+};
+
+PyMODINIT_FUNC
+PyInit_my_extension3(void)
+{
+    return PyModule_Create(&my_extension3);
+}
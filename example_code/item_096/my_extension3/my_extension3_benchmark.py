@@ -0,0 +1,115 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# my_extension3_benchmark.py
+import os
+import sys
+import timeit
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(HERE, "..", "my_extension"))
+sys.path.append(os.path.join(HERE, "..", "my_extension2"))
+
+import my_extension
+import my_extension2
+import my_extension3
+
+def measure(func, *args):
+    timer = timeit.Timer(lambda: func(*args))
+    number, delay = timer.autorange()
+    return delay / number
+
+def compare_sizes():
+    for size in (10, 1_000, 100_000):
+        left = [float(i % 7) for i in range(size)]
+        right = [float(i % 5) for i in range(size)]
+        left_array = array("d", left)
+        right_array = array("d", right)
+
+        expected = my_extension.dot_product(left, right)
+        assert my_extension2.dot_product(left, right) == expected
+        assert my_extension3.dot_product(left_array, right_array) == expected
+
+        lists = measure(my_extension.dot_product, left, right)
+        iterators = measure(my_extension2.dot_product, left, right)
+        buffers = measure(my_extension3.dot_product, left_array, right_array)
+        print(
+            f"Size {size:>7,}: "
+            f"lists {lists * 1e6:9.2f}us, "
+            f"iterators {iterators * 1e6:9.2f}us, "
+            f"buffers {buffers * 1e6:9.2f}us "
+            f"({lists / buffers:.1f}x faster than lists)"
+        )
+
+def make_matrix(rows, columns):
+    flat = array("d", (float(i % 11) for i in range(rows * columns)))
+    return flat, memoryview(flat).cast("B").cast("d", [rows, columns])
+
+def dot_each_row(flat, vector):
+    columns = len(vector)
+    view = memoryview(flat)
+    return [
+        my_extension3.dot_product(view[i : i + columns], vector)
+        for i in range(0, len(flat), columns)
+    ]
+
+def compare_batched():
+    rows, columns = 10_000, 100
+    flat, matrix = make_matrix(rows, columns)
+    vector = array("d", (float(i % 3) for i in range(columns)))
+    assert dot_each_row(flat, vector) == my_extension3.dot_products(
+        matrix, vector
+    )
+
+    single = measure(dot_each_row, flat, vector)
+    batched = measure(my_extension3.dot_products, matrix, vector)
+    print(
+        f"{rows:,}x{columns} matrix: "
+        f"per-row calls {single * 1e3:.2f}ms, "
+        f"dot_products {batched * 1e3:.2f}ms"
+    )
+
+def compare_threads():
+    flat, matrix = make_matrix(20_000, 500)
+    vector = array("d", (float(i % 3) for i in range(500)))
+
+    def run_serial():
+        for _ in range(4):
+            my_extension3.dot_products(matrix, vector)
+
+    def run_threads():
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            for _ in range(4):
+                pool.submit(my_extension3.dot_products, matrix, vector)
+
+    serial = measure(run_serial)
+    threaded = measure(run_threads)
+    # The speedup is only visible with more than one CPU core, since
+    # dot_products releases the GIL while it does the arithmetic
+    print(
+        f"4 batches on {os.cpu_count()} CPU(s): "
+        f"serial {serial * 1e3:.2f}ms, 4 threads {threaded * 1e3:.2f}ms"
+    )
+
+def main():
+    compare_sizes()
+    compare_batched()
+    compare_threads()
+
+if __name__ == "__main__":
+    main()
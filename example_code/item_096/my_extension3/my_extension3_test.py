@@ -0,0 +1,112 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# my_extension3_test.py
+import unittest
+from array import array
+import my_extension3
+
+def as_matrix(rows):
+    flat = array("d", [x for row in rows for x in row])
+    shape = [len(rows), len(rows[0])]
+    return memoryview(flat).cast("B").cast("d", shape)
+
+class MyExtension3Test(unittest.TestCase):
+
+    def test_empty(self):
+        result = my_extension3.dot_product(array("d"), array("d"))
+        self.assertAlmostEqual(0, result)
+
+    def test_positive_result(self):
+        result = my_extension3.dot_product(
+            array("d", [3, 4, 5]),
+            array("d", [-1, 9, -2.5]),
+        )
+        self.assertAlmostEqual(20.5, result)
+
+    def test_negative_result(self):
+        result = my_extension3.dot_product(
+            array("d", [-1, -1, -1]),
+            array("d", [1, 1, 1]),
+        )
+        self.assertAlmostEqual(-3, result)
+
+    def test_memoryview(self):
+        data = array("d", [0, 1, 2, 3, 4, 5])
+        view = memoryview(data)
+        result = my_extension3.dot_product(view[:3], view[3:])
+        self.assertAlmostEqual(14, result)
+
+    def test_not_buffers(self):
+        with self.assertRaises(TypeError):
+            my_extension3.dot_product([1.0, 2.0], array("d", [3, 4]))
+
+    def test_not_doubles(self):
+        with self.assertRaises(TypeError) as context:
+            my_extension3.dot_product(array("f", [1]), array("d", [1]))
+        self.assertEqual(
+            "Buffers must contain doubles", str(context.exception)
+        )
+
+        with self.assertRaises(TypeError) as context:
+            my_extension3.dot_product(array("d", [1]), b"12345678")
+        self.assertEqual(
+            "Buffers must contain doubles", str(context.exception)
+        )
+
+    def test_not_contiguous(self):
+        data = array("d", [1, 2, 3, 4])
+        with self.assertRaises(BufferError):
+            my_extension3.dot_product(memoryview(data)[::2], data[:2])
+
+    def test_mismatched_size(self):
+        with self.assertRaises(ValueError) as context:
+            my_extension3.dot_product(array("d", [1]), array("d", [2, 3]))
+        self.assertEqual(
+            "Buffers must be the same length", str(context.exception)
+        )
+
+    def test_dot_products(self):
+        matrix = as_matrix([[1, 2, 3], [4, 5, 6], [-1, 0, 1]])
+        vector = array("d", [1, 0.5, 2])
+        result = my_extension3.dot_products(matrix, vector)
+        self.assertEqual([8.0, 18.5, 1.0], result)
+
+    def test_dot_products_single_row(self):
+        matrix = as_matrix([[2, 3]])
+        result = my_extension3.dot_products(matrix, array("d", [4, 5]))
+        self.assertEqual([23.0], result)
+
+    def test_dot_products_bad_shape(self):
+        with self.assertRaises(ValueError) as context:
+            my_extension3.dot_products(array("d", [1, 2]), array("d", [1]))
+        self.assertEqual(
+            "Buffer must have 2 dimension(s), not 1",
+            str(context.exception),
+        )
+
+        with self.assertRaises(ValueError) as context:
+            my_extension3.dot_products(
+                as_matrix([[1, 2], [3, 4]]), array("d", [1])
+            )
+        self.assertEqual(
+            "Matrix rows must match the vector length",
+            str(context.exception),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
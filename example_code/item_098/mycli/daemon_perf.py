@@ -0,0 +1,101 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# daemon_perf.py
+import contextlib
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import mycli_client
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+COMMANDS = [
+    ["photo.jpg", "adjust", "--brightness", "1.5"],
+    ["photo.jpg", "enhance", "--amount", "2"],
+]
+
+@contextlib.contextmanager
+def run_daemon(path, *flags):
+    args = [sys.executable, "mycli_daemon.py", "--socket", path, *flags]
+    process = subprocess.Popen(
+        args, cwd=HERE, stdout=subprocess.PIPE, text=True
+    )
+    try:
+        process.stdout.readline()  # Wait until it's warm and listening
+        yield
+    finally:
+        process.terminate()
+        process.wait()
+        process.stdout.close()
+
+def invoke_scripts(script, count, path):
+    env = dict(os.environ, MYCLI_SOCKET=path)
+    for i in range(count):
+        subprocess.run(
+            [sys.executable, script, *COMMANDS[i % len(COMMANDS)]],
+            cwd=HERE,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            check=True,
+        )
+
+def send_requests(count, path):
+    for i in range(count):
+        argv = COMMANDS[i % len(COMMANDS)]
+        response = mycli_client.request(argv, path=path)
+        assert response["exit_code"] == 0, response
+        assert response["stdout"].startswith(("Adjusting!", "Enhancing!"))
+
+def measure(name, func, count, *args):
+    start = time.perf_counter()
+    func(count, *args)
+    end = time.perf_counter()
+    rate = count / (end - start)
+    print(f"{name:>34}: {rate:9.1f} invocations/sec")
+
+def main():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "mycli.sock")
+
+        measure("mycli.py", lambda n: invoke_scripts("mycli.py", n, path), 4)
+        measure(
+            "mycli_lazy.py",
+            lambda n: invoke_scripts("mycli_lazy.py", n, path),
+            4,
+        )
+
+        with run_daemon(path, "--workers", "4"):
+            measure(
+                "mycli_client.py, pre-forked",
+                lambda n: invoke_scripts("mycli_client.py", n, path),
+                20,
+            )
+            measure("requests, pre-forked", send_requests, 2000, path)
+
+        with run_daemon(path, "--fork-per-request"):
+            measure(
+                "mycli_client.py, fork-per-request",
+                lambda n: invoke_scripts("mycli_client.py", n, path),
+                20,
+            )
+            measure("requests, fork-per-request", send_requests, 500, path)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# import_report.py
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+import parser
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def parse_importtime(output):
+    modules = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line.split(":", 1)[1].split("|")
+        if not self_us.strip().isdigit():
+            continue  # Header line
+        # Nested imports are indented by two more spaces per level
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        modules.append((name.strip(), int(cumulative_us), depth))
+    return modules
+
+def measure(script, command):
+    args = [sys.executable, "-X", "importtime", script, "photo.jpg", command]
+    start = time.perf_counter()
+    result = subprocess.run(
+        args, cwd=HERE, capture_output=True, text=True, check=True
+    )
+    end = time.perf_counter()
+
+    top_level = [
+        (cumulative_us / 1e6, name)
+        for name, cumulative_us, depth in parse_importtime(result.stderr)
+        if depth == 0
+    ]
+    top_level.sort(reverse=True)
+    return dict(
+        wall=end - start,
+        imports=sum(seconds for seconds, _ in top_level),
+        slowest=[name for _, name in top_level[:3]],
+    )
+
+def report(script, repeat):
+    results = {}
+    for command, sub_parser in sorted(parser.sub_parsers.choices.items()):
+        runs = [measure(script, command) for _ in range(repeat)]
+        best = min(runs, key=lambda x: x["imports"])
+        best["module"] = sub_parser.get_default("module")
+        results[command] = best
+        print(
+            f"{command:>10} ({best['module']}): "
+            f"imports {best['imports'] * 1e3:8.1f}ms, "
+            f"wall {best['wall'] * 1e3:8.1f}ms, "
+            f"slowest {', '.join(best['slowest'])}"
+        )
+    return results
+
+def find_regressions(baseline, results, threshold, slack):
+    regressions = []
+    for command, result in results.items():
+        if command not in baseline:
+            continue
+        limit = baseline[command]["imports"] * (1 + threshold) + slack
+        if result["imports"] > limit:
+            regressions.append(command)
+    return regressions
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--script", default="mycli_lazy.py")
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    arg_parser.add_argument("--save", help="Write results to a JSON file")
+    arg_parser.add_argument("--baseline", help="Compare to a JSON file")
+    arg_parser.add_argument("--threshold", type=float, default=0.2)
+    arg_parser.add_argument("--slack", type=float, default=0.01)
+    args = arg_parser.parse_args()
+
+    results = report(args.script, args.repeat)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = find_regressions(
+            baseline, results, args.threshold, args.slack
+        )
+        if regressions:
+            print(f"Import time regressed: {', '.join(regressions)}")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# mycli_client.py
+# Keep imports to a minimum, since they're paid on every invocation
+import json
+import os
+import socket
+import stat
+import sys
+
+# Sockets live in a directory only this user can write to, otherwise
+# another user could bind the path first and answer our requests
+RUNTIME_DIR = os.environ.get("XDG_RUNTIME_DIR") or f"/tmp/mycli-{os.getuid()}"
+SOCKET_PATH = os.environ.get(
+    "MYCLI_SOCKET", os.path.join(RUNTIME_DIR, "mycli.sock")
+)
+
+def check_private_dir(path):
+    info = os.lstat(path)
+    if (
+        not stat.S_ISDIR(info.st_mode)
+        or info.st_uid != os.getuid()
+        or info.st_mode & 0o077
+    ):
+        raise PermissionError(f"{path} is not a private directory")
+
+def request(argv, prog="mycli.py", path=SOCKET_PATH):
+    check_private_dir(os.path.dirname(os.path.abspath(path)))
+    # The daemon runs the command from our directory and environment,
+    # so relative paths and settings mean the same thing as they would
+    # in a local run
+    message = dict(
+        prog=prog,
+        argv=argv,
+        cwd=os.getcwd(),
+        env=dict(os.environ),
+    )
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.connect(path)
+        conn.sendall(json.dumps(message).encode() + b"\n")
+        with conn.makefile("rb") as reader:
+            line = reader.readline()
+    if not line:
+        raise ConnectionError("Daemon closed the connection")
+    return json.loads(line)
+
+def main():
+    argv = sys.argv[1:]
+    try:
+        response = request(argv, prog=os.path.basename(sys.argv[0]))
+    except (FileNotFoundError, ConnectionRefusedError, PermissionError):
+        # No daemon running, or not one we can trust, so do the work in
+        # this process instead
+        import mycli_lazy
+
+        mycli_lazy.main()
+        return
+
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+    sys.exit(response["exit_code"])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# mycli_daemon.py
+import argparse
+import contextlib
+import io
+import json
+import os
+import signal
+import socket
+import stat
+import traceback
+
+import adjust   # Imported once here so every request starts warm
+import enhance
+import parser
+from mycli_client import SOCKET_PATH, check_private_dir
+
+def run_command(prog, argv, cwd, env):
+    # Each worker handles one request at a time, so it's safe to make
+    # usage messages, relative paths and environment variables look
+    # like the command is running in the client
+    parser.PARSER.prog = prog
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    with (
+        contextlib.redirect_stdout(stdout),
+        contextlib.redirect_stderr(stderr),
+    ):
+        try:
+            os.chdir(cwd)
+            os.environ.clear()
+            os.environ.update(env)
+            args = parser.PARSER.parse_args(argv)
+            if args.command == "enhance":
+                enhance.do_enhance(args.file, args.amount)
+            elif args.command == "adjust":
+                adjust.do_adjust(args.file, args.brightness, args.contrast)
+            else:
+                raise RuntimeError("Not reachable")
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else 1
+            if e.code is None:
+                exit_code = 0
+        except Exception:
+            traceback.print_exc()
+            exit_code = 1
+        else:
+            exit_code = 0
+
+    return dict(
+        exit_code=exit_code,
+        stdout=stdout.getvalue(),
+        stderr=stderr.getvalue(),
+    )
+
+def handle_connection(conn):
+    with conn, conn.makefile("rb") as reader:
+        line = reader.readline()
+        if not line:
+            return
+        message = json.loads(line)
+        response = run_command(
+            message["prog"], message["argv"], message["cwd"], message["env"]
+        )
+        conn.sendall(json.dumps(response).encode() + b"\n")
+
+def serve_forever(server):
+    while True:
+        conn, _ = server.accept()
+        try:
+            handle_connection(conn)
+        except Exception:
+            traceback.print_exc()
+
+def start_worker(server):
+    pid = os.fork()
+    if pid:
+        return pid
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    try:
+        serve_forever(server)
+    finally:
+        os._exit(1)
+
+def run_preforked(server, workers):
+    # All workers accept() on the same listening socket and the kernel
+    # hands each new connection to one of them
+    pids = {start_worker(server) for _ in range(workers)}
+    try:
+        while True:
+            pid, _ = os.wait()
+            pids.discard(pid)
+            pids.add(start_worker(server))
+    finally:
+        for pid in pids:
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGTERM)
+        for pid in pids:
+            with contextlib.suppress(ChildProcessError):
+                os.waitpid(pid, 0)
+
+def reap_children():
+    while True:
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if not pid:
+            return
+
+def run_fork_per_request(server):
+    while True:
+        conn, _ = server.accept()
+        pid = os.fork()
+        if pid:
+            conn.close()
+            reap_children()
+            continue
+        # The child inherits the already-imported modules, so it only
+        # pays for the fork, and it can't corrupt the parent's state
+        try:
+            server.close()
+            handle_connection(conn)
+        finally:
+            os._exit(0)
+
+def remove_stale_socket(path):
+    try:
+        info = os.lstat(path)
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(info.st_mode):
+        raise FileExistsError(f"{path} exists and is not a socket")
+    os.unlink(path)
+
+def stop(signum, frame):
+    raise SystemExit(0)
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--socket", default=SOCKET_PATH)
+    arg_parser.add_argument("--workers", type=int, default=4)
+    arg_parser.add_argument("--fork-per-request", action="store_true")
+    args = arg_parser.parse_args()
+
+    directory = os.path.dirname(os.path.abspath(args.socket))
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        check_private_dir(directory)
+        remove_stale_socket(args.socket)
+    except OSError as e:
+        arg_parser.error(str(e))
+
+    signal.signal(signal.SIGTERM, stop)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(args.socket)
+        server.listen(128)
+        print(f"Listening on {args.socket}", flush=True)
+        if args.fork_per_request:
+            run_fork_per_request(server)
+        else:
+            run_preforked(server, args.workers)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(args.socket)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2024 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# mycli_lazy.py
+import lazy
+import parser
+
+MODULES = lazy.subcommand_modules(parser.sub_parsers)
+
+def main():
+    args = parser.PARSER.parse_args()
+
+    if args.command == "enhance":
+        MODULES["enhance"].do_enhance(args.file, args.amount)
+    elif args.command == "adjust":
+        MODULES["adjust"].do_adjust(
+            args.file, args.brightness, args.contrast
+        )
+    else:
+        raise RuntimeError("Not reachable")
+
+if __name__ == "__main__":
+    main()
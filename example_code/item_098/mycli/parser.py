@@ -24,7 +24,9 @@ sub_parsers = PARSER.add_subparsers(dest="command")
 
 enhance_parser = sub_parsers.add_parser("enhance")
 enhance_parser.add_argument("--amount", type=float)
+enhance_parser.set_defaults(module="enhance")
 
 adjust_parser = sub_parsers.add_parser("adjust")
 adjust_parser.add_argument("--brightness", type=float)
 adjust_parser.add_argument("--contrast", type=float)
+adjust_parser.set_defaults(module="adjust")
@@ -223,3 +223,208 @@ result = (
 )
 
 print(f"{result:0.9f} seconds")
+
+
+print("Example 13")
+import mmap
+import threading
+import time
+import tracemalloc
+from socket import socketpair
+
+FRAMES_PER_SECOND = 30
+
+def parse_timecode(timecode):
+    hours, minutes, seconds, frames = map(int, timecode.split(":"))
+    total = (hours * 60 + minutes) * 60 + seconds
+    return total + frames / FRAMES_PER_SECOND
+
+class VideoCache:
+    def __init__(self, size, bytes_per_second, path=None):
+        self.size = size
+        self.bytes_per_second = bytes_per_second
+        self.file = None
+        if path is None:
+            self.buffer = bytearray(size)
+        else:
+            self.file = open(path, "w+b")
+            self.file.truncate(size)
+            self.buffer = mmap.mmap(self.file.fileno(), size)
+        self.view = memoryview(self.buffer)
+
+    def close(self):
+        self.view.release()
+        if self.file is not None:
+            self.buffer.close()
+            self.file.close()
+
+    def timecode_to_index(self, timecode):
+        seconds = parse_timecode(timecode)
+        byte_offset = int(seconds * self.bytes_per_second)
+        if not 0 <= byte_offset < self.size:
+            raise ValueError(f"Timecode {timecode} is out of range")
+        return byte_offset
+
+    def request_chunk(self, byte_offset, size):
+        return self.view[byte_offset : byte_offset + size]
+
+    def receive_chunk(self, sock, byte_offset, size):
+        received = 0
+        # Release the slice even on errors, or the cache can't be closed
+        with self.request_chunk(byte_offset, size) as chunk:
+            while received < len(chunk):
+                with chunk[received:] as remaining:
+                    count = sock.recv_into(remaining)
+                if not count:
+                    raise ConnectionError("Connection closed mid-chunk")
+                received += count
+        return received
+
+    def send_chunk(self, sock, byte_offset, size):
+        if self.file is not None:
+            # The kernel copies straight from the page cache that
+            # backs the mmap, without going through Python at all
+            return sock.sendfile(self.file, byte_offset, size)
+        with self.request_chunk(byte_offset, size) as chunk:
+            sock.sendall(chunk)
+            return len(chunk)
+
+
+print("Example 14")
+def send_chunks(sock, source, chunk_size, count):
+    with memoryview(source) as view:
+        for i in range(count):
+            sock.sendall(view[i * chunk_size : (i + 1) * chunk_size])
+
+def recv_exactly(sock, size):
+    parts = []
+    remaining = size
+    while remaining:
+        part = sock.recv(remaining)
+        if not part:
+            raise ConnectionError("Connection closed mid-chunk")
+        parts.append(part)
+        remaining -= len(part)
+    return b"".join(parts)
+
+def update_with_join(cache, sock, byte_offset, size):
+    chunk = recv_exactly(sock, size)
+    with memoryview(cache) as view:
+        before = view[:byte_offset]
+        after = view[byte_offset + size :]
+        return b"".join([before, chunk, after])
+
+def update_in_place(cache, sock, byte_offset, size):
+    cache.receive_chunk(sock, byte_offset, size)
+    return cache
+
+def stream_chunks(update, cache, source, chunk_size, count, trace=False):
+    reader, writer = socketpair()
+    sender = threading.Thread(
+        target=send_chunks, args=(writer, source, chunk_size, count)
+    )
+    peaks = []
+    start = time.perf_counter()
+    sender.start()
+    for i in range(count):
+        if trace:
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+        cache = update(cache, reader, i * chunk_size, chunk_size)
+        if trace:
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+    sender.join()
+    end = time.perf_counter()
+    reader.close()
+    writer.close()
+    return cache, end - start, peaks
+
+
+print("Example 15")
+cache_size = 100 * 1024 * 1024
+chunk_size = 1024 * 1024
+chunk_count = 10
+source = os.urandom(chunk_size * chunk_count)
+
+def run_join(trace=False):
+    cache = bytes(cache_size)
+    return stream_chunks(
+        update_with_join, cache, source, chunk_size, chunk_count, trace
+    )
+
+def run_in_place(trace=False):
+    cache = VideoCache(cache_size, bytes_per_second=chunk_size)
+    return stream_chunks(
+        update_in_place, cache, source, chunk_size, chunk_count, trace
+    )
+
+for name, run in [("join", run_join), ("recv_into", run_in_place)]:
+    cache, delay, _ = run()
+    if isinstance(cache, VideoCache):
+        cached = cache.request_chunk(0, len(source))
+        assert cached == source
+        cached.release()
+        cache.close()
+    else:
+        assert cache[: len(source)] == source
+
+    tracemalloc.start()
+    cache, _, peaks = run(trace=True)
+    tracemalloc.stop()
+    if isinstance(cache, VideoCache):
+        cache.close()
+
+    megabytes = chunk_size * chunk_count / 1024 / 1024
+    per_chunk = sum(peaks) / len(peaks) / 1024
+    print(
+        f"{name:>9}: {megabytes / delay:8.1f} MB/s, "
+        f"{per_chunk:10.1f} KiB allocated per chunk"
+    )
+
+
+print("Example 16")
+def serve_timecode(cache, sock, timecode, size):
+    byte_offset = cache.timecode_to_index(timecode)
+    return cache.send_chunk(sock, byte_offset, size)
+
+for path in (None, "video.cache"):
+    cache = VideoCache(cache_size, bytes_per_second=chunk_size, path=path)
+    reader, writer = socketpair()
+    sender = threading.Thread(
+        target=send_chunks, args=(writer, source, chunk_size, chunk_count)
+    )
+    sender.start()
+    for i in range(chunk_count):
+        cache.receive_chunk(reader, i * chunk_size, chunk_size)
+    sender.join()
+
+    timecode = "00:00:03:15"  # 3.5 seconds in
+    server = threading.Thread(
+        target=serve_timecode, args=(cache, writer, timecode, chunk_size)
+    )
+    server.start()
+    served = recv_exactly(reader, chunk_size)
+    server.join()
+
+    byte_offset = cache.timecode_to_index(timecode)
+    assert served == source[byte_offset : byte_offset + chunk_size]
+    print(f"Served {len(served)} bytes from offset {byte_offset}")
+    reader.close()
+    writer.close()
+    cache.close()
+
+
+cache = VideoCache(cache_size, bytes_per_second=chunk_size, path="video.cache")
+reader, writer = socketpair()
+writer.sendall(b"only part of a chunk")
+writer.close()
+try:
+    cache.receive_chunk(reader, 0, chunk_size)
+except ConnectionError:
+    pass
+else:
+    assert False
+reader.close()
+cache.close()  # Doesn't raise BufferError, since the slice was released
+print("Closed the cache after a failed receive")